@@ -43,7 +43,7 @@ async def classify_thought(text: str) -> dict:
         max_tokens=500,
     )
 
-    logger.info(f"Classification result: {result}")
+    logger.info("Classification result: %s", result)
     return result
 
 
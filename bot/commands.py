@@ -86,13 +86,14 @@ async def format_search_results(
     # Debug logging
     import logging
     logger = logging.getLogger(__name__)
-    logger.info(f"format_search_results: query={query}, num_results={len(results)}, all_references={all_references}")
-    for r in results:
-        source = r.get("source_table", "unknown")
-        title = r.get("title", r.get("name", "N/A"))
-        content = r.get("content") or r.get("decision") or ""
-        content_len = len(content) if content else 0
-        logger.info(f"  - {source}: {title} (content length: {content_len} chars)")
+    logger.info("format_search_results: query=%s, num_results=%s, all_references=%s", query, len(results), all_references)
+    if logger.isEnabledFor(logging.INFO):
+        for r in results:
+            source = r.get("source_table", "unknown")
+            title = r.get("title", r.get("name", "N/A"))
+            content = r.get("content") or r.get("decision") or ""
+            content_len = len(content) if content else 0
+            logger.info("  - %s: %s (content length: %s chars)", source, title, content_len)
 
     if all_references:
         # Return full content with fenced markdown formatting
@@ -183,7 +184,7 @@ def _format_reference_results(query: str, results: List[Dict[str, Any]]) -> str:
         lines.append("")  # Blank line between results
 
     result = "\n".join(lines)
-    logger.info(f"_format_reference_results: Formatted {len(results)} results, total length: {len(result)} chars")
+    logger.info("_format_reference_results: Formatted %s results, total length: %s chars", len(results), len(result))
     return result
 
 
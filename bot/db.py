@@ -1,10 +1,16 @@
 """Database operations using asyncpg."""
 
+import asyncio
+import json
+import logging
+
 import asyncpg
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import date, datetime
 from bot.config import Config
 
+logger = logging.getLogger(__name__)
+
 _pool: Optional[asyncpg.Pool] = None
 
 
@@ -12,10 +18,41 @@ async def get_pool() -> asyncpg.Pool:
     """Get or create the database connection pool."""
     global _pool
     if _pool is None:
-        _pool = await asyncpg.create_pool(Config.DATABASE_URL)
+        # Keep warm connections around so concurrent searches and replies
+        # don't serialize on pool capacity, recycle connections after 50k
+        # queries, and give the statement cache room for every query shape.
+        _pool = await asyncpg.create_pool(
+            Config.DATABASE_URL,
+            min_size=10,
+            max_size=50,
+            max_queries=50_000,
+            max_inactive_connection_lifetime=300,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+            command_timeout=60,
+        )
+        logger.info(
+            "Connection pool created (size=%s, idle=%s)",
+            _pool.get_size(),
+            _pool.get_idle_size(),
+        )
+    return _pool
+
+
+def current_pool() -> Optional[asyncpg.Pool]:
+    """Return the pool if it has already been created, without awaiting.
+
+    Hot paths use `current_pool() or await get_pool()` so the steady state
+    skips the coroutine round trip through get_pool entirely.
+    """
     return _pool
 
 
+async def init_db() -> asyncpg.Pool:
+    """Create the connection pool eagerly at startup."""
+    return await get_pool()
+
+
 async def close_pool():
     """Close the database connection pool."""
     global _pool
@@ -27,7 +64,7 @@ async def close_pool():
 async def check_health() -> bool:
     """Verify database connection is healthy."""
     try:
-        pool = await get_pool()
+        pool = current_pool() or await get_pool()
         async with pool.acquire() as conn:
             await conn.fetchval("SELECT 1")
         return True
@@ -35,16 +72,33 @@ async def check_health() -> bool:
         return False
 
 
+async def check_health_fast(timeout: float = 1.0) -> bool:
+    """Probe the database with a single direct connection.
+
+    For monitors that run every few seconds: opens one connection,
+    runs SELECT 1 and closes, instead of warming up a full pool of
+    min_size connections just to answer a liveness check.
+    """
+    try:
+        conn = await asyncio.wait_for(
+            asyncpg.connect(Config.DATABASE_URL), timeout
+        )
+        try:
+            await conn.fetchval("SELECT 1")
+        finally:
+            await conn.close()
+        return True
+    except Exception:
+        return False
+
+
 # =============================================================================
 # Generic CRUD Operations
 # =============================================================================
 
 
-async def insert_record(table: str, data: dict) -> str:
-    """Insert a record and return its ID."""
-    pool = await get_pool()
-
-    # Convert date strings to date objects
+def _convert_dates(data: dict) -> dict:
+    """Convert ISO date strings to date objects for date-typed columns."""
     converted_data = {}
     for key, value in data.items():
         if key in ("due_date", "last_touched") and isinstance(value, str):
@@ -56,6 +110,14 @@ async def insert_record(table: str, data: dict) -> str:
                 continue
         else:
             converted_data[key] = value
+    return converted_data
+
+
+async def insert_record(table: str, data: dict) -> str:
+    """Insert a record and return its ID."""
+    pool = current_pool() or await get_pool()
+
+    converted_data = _convert_dates(data)
 
     columns = ", ".join(converted_data.keys())
     placeholders = ", ".join(f"${i+1}" for i in range(len(converted_data)))
@@ -70,7 +132,7 @@ async def insert_record(table: str, data: dict) -> str:
 
 async def update_record(table: str, record_id: str, data: dict) -> bool:
     """Update a record by ID."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     set_clause = ", ".join(f"{k} = ${i+2}" for i, k in enumerate(data.keys()))
     values = [record_id] + list(data.values())
@@ -84,7 +146,7 @@ async def update_record(table: str, record_id: str, data: dict) -> bool:
 
 async def delete_record(table: str, record_id: str) -> bool:
     """Delete a record by ID."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         result = await conn.execute(f"DELETE FROM {table} WHERE id = $1", record_id)
@@ -93,7 +155,7 @@ async def delete_record(table: str, record_id: str) -> bool:
 
 async def get_record(table: str, record_id: str) -> Optional[Dict[str, Any]]:
     """Get a record by ID."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         row = await conn.fetchrow(f"SELECT * FROM {table} WHERE id = $1", record_id)
@@ -129,9 +191,103 @@ async def insert_inbox_log(
     )
 
 
+async def insert_record_with_log(
+    table: str,
+    data: dict,
+    *,
+    raw_text: str,
+    destination: Optional[str],
+    confidence: Optional[float],
+    status: str,
+    telegram_message_id: str,
+    telegram_chat_id: str,
+) -> str:
+    """Insert a record and its inbox_log entry in a single round trip.
+
+    Uses a data-modifying CTE so both rows are written by one statement
+    instead of two sequential inserts. Returns the new record's ID.
+    """
+    pool = current_pool() or await get_pool()
+
+    converted_data = _convert_dates(data)
+
+    columns = ", ".join(converted_data.keys())
+    placeholders = ", ".join(f"${i+1}" for i in range(len(converted_data)))
+    values = list(converted_data.values())
+    n = len(values)
+
+    query = f"""
+        WITH new_rec AS (
+            INSERT INTO {table} ({columns}) VALUES ({placeholders}) RETURNING id
+        )
+        INSERT INTO inbox_log
+            (raw_text, destination, record_id, confidence, status,
+             telegram_message_id, telegram_chat_id)
+        SELECT ${n+1}, ${n+2}, id, ${n+3}, ${n+4}, ${n+5}, ${n+6} FROM new_rec
+        RETURNING record_id
+    """
+
+    async with pool.acquire() as conn:
+        record_id = await conn.fetchval(
+            query,
+            *values,
+            raw_text,
+            destination,
+            confidence,
+            status,
+            telegram_message_id,
+            telegram_chat_id,
+        )
+        return str(record_id)
+
+
+async def apply_fix(
+    old_table: Optional[str],
+    old_record_id: Optional[str],
+    new_table: str,
+    data: dict,
+    log_id: str,
+) -> str:
+    """Apply a reclassification fix atomically.
+
+    Deletes the old record (if any), inserts the replacement and updates
+    the inbox_log entry inside one transaction on a single connection —
+    one commit instead of three, and the log can never end up pointing at
+    a deleted record. Returns the new record's ID.
+    """
+    pool = current_pool() or await get_pool()
+
+    converted_data = _convert_dates(data)
+    columns = ", ".join(converted_data.keys())
+    placeholders = ", ".join(f"${i+1}" for i in range(len(converted_data)))
+    values = list(converted_data.values())
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            if old_table and old_record_id:
+                await conn.execute(
+                    f"DELETE FROM {old_table} WHERE id = $1", old_record_id
+                )
+            new_record_id = await conn.fetchval(
+                f"INSERT INTO {new_table} ({columns}) VALUES ({placeholders}) RETURNING id",
+                *values,
+            )
+            await conn.execute(
+                """
+                UPDATE inbox_log
+                SET destination = $2, record_id = $3, status = 'fixed'
+                WHERE id = $1
+                """,
+                log_id,
+                new_table,
+                new_record_id,
+            )
+    return str(new_record_id)
+
+
 async def update_inbox_log(log_id: str, data: dict) -> bool:
     """Update an inbox log entry."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     set_clause = ", ".join(f"{k} = ${i+2}" for i, k in enumerate(data.keys()))
     values = [log_id] + list(data.values())
@@ -145,7 +301,7 @@ async def update_inbox_log(log_id: str, data: dict) -> bool:
 
 async def get_inbox_log_by_event(telegram_message_id: str) -> Optional[Dict[str, Any]]:
     """Get inbox log by Telegram message ID."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
@@ -159,39 +315,82 @@ async def get_inbox_log_by_event(telegram_message_id: str) -> Optional[Dict[str,
 # =============================================================================
 
 
-async def insert_pending_clarification(
+async def upsert_pending_clarification(
     inbox_log_id: str,
     telegram_message_id: str,
     telegram_chat_id: str,
     suggested_category: Optional[str],
 ) -> str:
-    """Create a pending clarification entry."""
-    return await insert_record(
-        "pending_clarifications",
-        {
-            "inbox_log_id": inbox_log_id,
-            "telegram_message_id": telegram_message_id,
-            "telegram_chat_id": telegram_chat_id,
-            "suggested_category": suggested_category,
-        },
-    )
+    """Create or refresh a pending clarification in a single round trip.
 
+    Replaces the delete-then-insert pattern when a clarification is re-sent
+    for the same bot message.
+    """
+    pool = current_pool() or await get_pool()
 
-async def get_pending_by_reply_to(original_message_id: str) -> Optional[Dict[str, Any]]:
-    """Get pending clarification by the original message it's replying to."""
-    pool = await get_pool()
+    async with pool.acquire() as conn:
+        record_id = await conn.fetchval(
+            """
+            INSERT INTO pending_clarifications
+                (inbox_log_id, telegram_message_id, telegram_chat_id, suggested_category)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (telegram_message_id) DO UPDATE
+                SET inbox_log_id = EXCLUDED.inbox_log_id,
+                    telegram_chat_id = EXCLUDED.telegram_chat_id,
+                    suggested_category = EXCLUDED.suggested_category
+            RETURNING id
+            """,
+            inbox_log_id,
+            telegram_message_id,
+            telegram_chat_id,
+            suggested_category,
+        )
+        return str(record_id)
+
+
+async def get_reply_context(
+    reply_to_message_id: str,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Fetch the inbox log entry and pending clarification for a reply target.
+
+    The reply handler needs both to decide whether a reply is a fix command
+    or a clarification response; fetching them in one UNION ALL query costs
+    a single round trip instead of two.
+
+    Returns: (inbox_log entry or None, pending clarification or None)
+    """
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
+        rows = await conn.fetch(
             """
-            SELECT pc.*, il.raw_text
-            FROM pending_clarifications pc
-            JOIN inbox_log il ON pc.inbox_log_id = il.id
-            WHERE pc.telegram_message_id = $1
+            SELECT 'log' AS kind, row_to_json(l) AS data
+            FROM inbox_log l
+            WHERE l.telegram_message_id = $1
+            UNION ALL
+            SELECT 'pending', row_to_json(p)
+            FROM (
+                SELECT pc.*, il.raw_text
+                FROM pending_clarifications pc
+                JOIN inbox_log il ON pc.inbox_log_id = il.id
+                WHERE pc.telegram_message_id = $1
+            ) p
             """,
-            original_message_id,
+            reply_to_message_id,
         )
-        return dict(row) if row else None
+
+    log_entry = None
+    pending = None
+    for row in rows:
+        data = row["data"]
+        if isinstance(data, str):
+            data = json.loads(data)
+        if row["kind"] == "log":
+            log_entry = data
+        else:
+            pending = data
+
+    return log_entry, pending
 
 
 async def delete_pending_clarification(clarification_id: str) -> bool:
@@ -201,7 +400,7 @@ async def delete_pending_clarification(clarification_id: str) -> bool:
 
 async def cleanup_old_pending(days: int = 7) -> int:
     """Delete pending clarifications older than N days."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         result = await conn.execute(
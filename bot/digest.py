@@ -7,8 +7,7 @@ from bot.config import Config
 from queries import (
     get_active_projects,
     get_blocked_projects,
-    get_admin_due_soon,
-    get_overdue_admin,
+    get_admin_dashboard,
     get_people_with_followups,
     get_recent_decisions,
 )
@@ -35,8 +34,9 @@ async def generate_daily_digest() -> str:
     # Gather data
     active_projects = await get_active_projects(limit=10)
     blocked_projects = await get_blocked_projects()
-    overdue = await get_overdue_admin()
-    due_soon = await get_admin_due_soon(days=3)
+    admin_buckets = await get_admin_dashboard(days=3)
+    overdue = admin_buckets["overdue"]
+    due_soon = admin_buckets["due_soon"]
     people = await get_people_with_followups()
     decisions = await get_recent_decisions(days=7, limit=1)
 
@@ -3,13 +3,7 @@
 import re
 from typing import Optional, Tuple
 
-from bot.db import (
-    get_inbox_log_by_event,
-    get_record,
-    delete_record,
-    insert_record,
-    update_inbox_log,
-)
+from bot.db import apply_fix, get_inbox_log_by_event
 from classifier import classify_thought, parse_reference
 from router import CATEGORY_TABLE_MAP, CATEGORY_DISPLAY
 
@@ -77,10 +71,6 @@ async def handle_fix(
         display = CATEGORY_DISPLAY.get(new_category, new_category)
         return False, f"Already filed as {display}", None, None
 
-    # Delete old record if it exists
-    if old_record_id and old_category:
-        await delete_record(old_category, str(old_record_id))
-
     # Re-classify for the new category
     if new_category in ("decisions", "howtos", "snippets"):
         # Reference categories need the prefix - add it and re-parse
@@ -95,7 +85,6 @@ async def handle_fix(
 
         if ref_result:
             extracted = ref_result["extracted"]
-            new_record_id = await insert_record(new_category, extracted)
             extracted_name = (
                 extracted.get("title") or extracted.get("name") or raw_text[:50]
             )
@@ -127,21 +116,20 @@ async def handle_fix(
             except Exception:
                 pass  # Tags are optional, continue without them
 
-            new_record_id = await insert_record(new_category, extracted)
             extracted_name = (
                 extracted.get("name") or extracted.get("title") or raw_text[:50]
             )
         else:
             return False, f"Couldn't extract data for category '{new_category}'", None, None
 
-    # Update inbox log
-    await update_inbox_log(
-        str(log_entry["id"]),
-        {
-            "destination": new_category,
-            "record_id": new_record_id,
-            "status": "fixed",
-        },
+    # Delete the old record, insert the new one and update the inbox log
+    # in one transaction
+    await apply_fix(
+        old_table=old_category if old_record_id else None,
+        old_record_id=str(old_record_id) if old_record_id else None,
+        new_table=new_category,
+        data=extracted,
+        log_id=str(log_entry["id"]),
     )
 
     old_display = CATEGORY_DISPLAY.get(old_category, old_category) if old_category else "unknown"
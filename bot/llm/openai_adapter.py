@@ -59,6 +59,25 @@ class OpenAIAdapter(LLMClient):
         self.model = model
         self.default_max_tokens = default_max_tokens
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive between completions,
+        so retries and successive calls skip the TCP + TLS handshake.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
     @property
     def provider_name(self) -> str:
@@ -119,32 +138,32 @@ class OpenAIAdapter(LLMClient):
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        self.api_url,
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json=body,
-                    )
-                    response.raise_for_status()
-
-                    data = response.json()
-
-                    # Extract content from OpenAI format
-                    content = data["choices"][0]["message"]["content"]
-
-                    # Extract usage if present
-                    usage = data.get("usage")
-
-                    return LLMResponse(
-                        content=content,
-                        model=data.get("model", self.model),
-                        provider=self.provider_name,
-                        usage=usage,
-                        raw_response=data,
-                    )
+                client = self._get_client()
+                response = await client.post(
+                    self.api_url,
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json=body,
+                )
+                response.raise_for_status()
+
+                data = response.json()
+
+                # Extract content from OpenAI format
+                content = data["choices"][0]["message"]["content"]
+
+                # Extract usage if present
+                usage = data.get("usage")
+
+                return LLMResponse(
+                    content=content,
+                    model=data.get("model", self.model),
+                    provider=self.provider_name,
+                    usage=usage,
+                    raw_response=data,
+                )
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -159,7 +178,7 @@ class OpenAIAdapter(LLMClient):
                 except Exception:
                     error_body = e.response.text
 
-                logger.error(f"HTTP Error {e.response.status_code}: {error_body}")
+                logger.error("HTTP Error %s: %s", e.response.status_code, error_body)
 
                 # Retry on server errors, raise on client errors
                 if e.response.status_code >= 500:
@@ -18,9 +18,10 @@ from bot.config import Config
 from router import route_message, CATEGORY_DISPLAY
 from bot.db import (
     close_pool,
+    init_db,
     get_record,
-    insert_pending_clarification,
-    get_pending_by_reply_to,
+    upsert_pending_clarification,
+    get_reply_context,
     delete_pending_clarification,
     get_inbox_log_by_event,
     insert_inbox_log,
@@ -41,6 +42,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget tasks so they aren't garbage-collected
+# before completing
+_background_tasks: set = set()
+
+
+def _run_in_background(coro) -> None:
+    """Schedule a coroutine without awaiting it.
+
+    Used for writes whose result the reply doesn't depend on, so the
+    user-visible response isn't delayed by an extra DB round trip.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 
 class LeaknoteBot:
     """Telegram bot for Leaknote."""
@@ -67,7 +83,7 @@ class LeaknoteBot:
         """Handle /start command."""
         # Security check - only owner can use /start
         if update.effective_user.id != Config.TELEGRAM_OWNER_ID:
-            logger.warning(f"Unauthorized /start attempt from user {update.effective_user.id}")
+            logger.warning("Unauthorized /start attempt from user %s", update.effective_user.id)
             return
 
         await update.message.reply_text(self._get_help_text())
@@ -76,7 +92,7 @@ class LeaknoteBot:
         """Handle /help command."""
         # Security check - only owner can use /help
         if update.effective_user.id != Config.TELEGRAM_OWNER_ID:
-            logger.warning(f"Unauthorized /help attempt from user {update.effective_user.id}")
+            logger.warning("Unauthorized /help attempt from user %s", update.effective_user.id)
             return
 
         await update.message.reply_text(self._get_help_text())
@@ -86,7 +102,7 @@ class LeaknoteBot:
         # Security check - only allow messages from the owner
         # Works with both DMs and channels (as long as owner sends them)
         if update.effective_user.id != Config.TELEGRAM_OWNER_ID:
-            logger.warning(f"Unauthorized message from user {update.effective_user.id} in chat {update.effective_chat.id}")
+            logger.warning("Unauthorized message from user %s in chat %s", update.effective_user.id, update.effective_chat.id)
             return
 
         message = update.message
@@ -95,7 +111,8 @@ class LeaknoteBot:
         if not text:
             return
 
-        logger.info(f"Message from {update.effective_user.id} in chat {update.effective_chat.id} (msg_id {message.message_id}): {text[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Message from %s in chat %s (msg_id %s): %s...", update.effective_user.id, update.effective_chat.id, message.message_id, text[:50])
 
         # Check if this is a reply to a bot message (clarification or fix)
         if message.reply_to_message and message.reply_to_message.from_user.is_bot:
@@ -151,9 +168,9 @@ class LeaknoteBot:
 
         elif status == "needs_review":
             # Low confidence or error - ask for clarification
-            logger.info(f"Checking for inbox_log with telegram_message_id: {message_id}")
+            logger.info("Checking for inbox_log with telegram_message_id: %s", message_id)
             log_entry = await get_inbox_log_by_event(str(message_id))
-            logger.info(f"Found log_entry: {log_entry}")
+            logger.info("Found log_entry: %s", log_entry)
 
             clarification_message_id = await send_clarification_request(
                 context.bot,
@@ -162,20 +179,20 @@ class LeaknoteBot:
                 category,
                 confidence,
             )
-            logger.info(f"Sent clarification request with message_id: {clarification_message_id}")
+            logger.info("Sent clarification request with message_id: %s", clarification_message_id)
 
             # Store pending clarification
             if log_entry:
-                logger.info(f"Creating pending clarification for inbox_log_id: {log_entry['id']}")
-                await insert_pending_clarification(
+                logger.info("Creating pending clarification for inbox_log_id: %s", log_entry["id"])
+                await upsert_pending_clarification(
                     inbox_log_id=str(log_entry["id"]),
                     telegram_message_id=str(clarification_message_id),
                     telegram_chat_id=str(chat_id),
                     suggested_category=category,
                 )
-                logger.info(f"Pending clarification created successfully")
+                logger.info("Pending clarification created successfully")
             else:
-                logger.warning(f"No log_entry found, cannot create pending clarification!")
+                logger.warning("No log_entry found, cannot create pending clarification!")
 
     async def handle_reply(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle reply to clarification request or fix command."""
@@ -184,7 +201,11 @@ class LeaknoteBot:
         chat_id = update.effective_chat.id
         message_id = update.message.message_id
 
-        logger.info(f"Reply text: '{text}'")
+        logger.info("Reply text: '%s'", text)
+
+        # Fetch the inbox log and pending clarification for the replied-to
+        # message in one round trip; both branches below need them
+        log_entry, pending = await get_reply_context(str(reply_to_message_id))
 
         # Check if it's a fix command
         fix_category = parse_fix_command(text)
@@ -193,11 +214,9 @@ class LeaknoteBot:
             # The user replied to the bot's confirmation, which itself is a reply to the original message
             original_message_id = update.message.reply_to_message.reply_to_message.message_id if update.message.reply_to_message.reply_to_message else None
 
-            if not original_message_id:
-                # Fallback: try to find inbox_log by the clarification message
-                log_entry = await get_inbox_log_by_event(str(reply_to_message_id))
-                if log_entry:
-                    original_message_id = log_entry.get("telegram_message_id")
+            if not original_message_id and log_entry:
+                # Fallback: the inbox_log entry for the replied-to message
+                original_message_id = log_entry.get("telegram_message_id")
 
             if not original_message_id:
                 await send_error(
@@ -208,7 +227,7 @@ class LeaknoteBot:
                 )
                 return
 
-            logger.info(f"Fix command: original message {original_message_id}, changing to {fix_category}")
+            logger.info("Fix command: original message %s, changing to %s", original_message_id, fix_category)
 
             success, msg, old_category, extracted_name = await handle_fix(
                 str(original_message_id), fix_category
@@ -228,11 +247,10 @@ class LeaknoteBot:
             return
 
         # Check if it's a clarification response
-        pending = await get_pending_by_reply_to(str(reply_to_message_id))
         if pending:
             # User is clarifying a previous uncertain message
             if text.lower() == "skip":
-                await delete_pending_clarification(str(pending["id"]))
+                _run_in_background(delete_pending_clarification(str(pending["id"])))
                 await send_message(
                     context.bot,
                     chat_id,
@@ -266,9 +284,8 @@ class LeaknoteBot:
                 # Not a recognized category - treat their reply as completely new input
                 new_text = text
 
-            # Get the original message_id from pending clarification
-            original_log = await get_inbox_log_by_event(pending.get("telegram_message_id"))
-            original_message_id = original_log.get("telegram_message_id") if original_log else str(message_id)
+            # Get the original message_id from the inbox log entry, if any
+            original_message_id = log_entry.get("telegram_message_id") if log_entry else str(message_id)
 
             category, record_id, confidence, status = await route_message(
                 new_text,
@@ -276,7 +293,7 @@ class LeaknoteBot:
                 str(chat_id),
             )
 
-            await delete_pending_clarification(str(pending["id"]))
+            _run_in_background(delete_pending_clarification(str(pending["id"])))
 
             if status == "filed" and record_id:
                 table = category
@@ -306,13 +323,14 @@ class LeaknoteBot:
     async def handle_query_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE, command_result):
         """Handle ?recall, ?search, etc."""
         command, arg = command_result
-        logger.info(f"Command: {command}, arg: {arg}")
+        logger.info("Command: %s, arg: %s", command, arg)
 
         try:
             response = await handle_command(command, arg)
-            logger.info(f"Command response: {response[:100]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Command response: %s...", response[:100])
         except Exception as e:
-            logger.error(f"Command error: {e}")
+            logger.error("Command error: %s", e)
             response = f"Error: {str(e)}"
 
         # Telegram has 4096 char limit per message - split if needed
@@ -387,9 +405,13 @@ async def main():
     # Validate config
     missing = Config.validate()
     if missing:
-        logger.error(f"Missing configuration: {', '.join(missing)}")
+        logger.error("Missing configuration: %s", ", ".join(missing))
         sys.exit(1)
 
+    # Create the connection pool up front so the first message doesn't pay
+    # pool-creation latency
+    await init_db()
+
     # Start bot
     bot = LeaknoteBot()
     try:
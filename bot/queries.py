@@ -1,9 +1,13 @@
 """Database queries for digests, reviews, and search."""
 
-from typing import List, Dict, Any, Optional
+import json
+from time import monotonic
+from typing import List, Dict, Any, Optional, Tuple
+
+import asyncpg
 from datetime import datetime, timedelta
 
-from bot.db import get_pool
+from bot.db import current_pool, get_pool
 
 
 # =============================================================================
@@ -11,14 +15,15 @@ from bot.db import get_pool
 # =============================================================================
 
 
-async def get_active_projects(limit: int = 10) -> List[Dict[str, Any]]:
+async def get_active_projects(limit: int = 10) -> List[asyncpg.Record]:
     """Get active projects with next actions."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         rows = await conn.fetch(
             """
-            SELECT id, name, status, next_action, notes, tags, updated_at
+            SELECT id, name, status, next_action, notes, tags, updated_at,
+                   to_char(updated_at, 'Dy') AS updated_dow
             FROM projects
             WHERE status = 'active'
             ORDER BY updated_at DESC
@@ -26,28 +31,29 @@ async def get_active_projects(limit: int = 10) -> List[Dict[str, Any]]:
             """,
             limit,
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
-async def get_waiting_projects() -> List[Dict[str, Any]]:
+async def get_waiting_projects() -> List[asyncpg.Record]:
     """Get projects in waiting status."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         rows = await conn.fetch(
             """
-            SELECT id, name, status, next_action, notes, updated_at
+            SELECT id, name, status, next_action, notes, updated_at,
+                   to_char(updated_at, 'Mon DD') AS updated_md
             FROM projects
             WHERE status = 'waiting'
             ORDER BY updated_at DESC
             """
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
-async def get_blocked_projects() -> List[Dict[str, Any]]:
+async def get_blocked_projects() -> List[asyncpg.Record]:
     """Get blocked projects."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         rows = await conn.fetch(
@@ -58,12 +64,12 @@ async def get_blocked_projects() -> List[Dict[str, Any]]:
             ORDER BY updated_at DESC
             """
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
-async def list_projects(status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+async def list_projects(status: Optional[str] = None, limit: int = 20) -> List[asyncpg.Record]:
     """List projects, optionally filtered by status."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         if status:
@@ -96,7 +102,7 @@ async def list_projects(status: Optional[str] = None, limit: int = 20) -> List[D
                 """,
                 limit,
             )
-        return [dict(row) for row in rows]
+        return rows
 
 
 # =============================================================================
@@ -104,9 +110,9 @@ async def list_projects(status: Optional[str] = None, limit: int = 20) -> List[D
 # =============================================================================
 
 
-async def get_admin_due_soon(days: int = 7) -> List[Dict[str, Any]]:
+async def get_admin_due_soon(days: int = 7) -> List[asyncpg.Record]:
     """Get admin tasks due within N days."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
     cutoff = datetime.now().date() + timedelta(days=days)
 
     async with pool.acquire() as conn:
@@ -121,12 +127,12 @@ async def get_admin_due_soon(days: int = 7) -> List[Dict[str, Any]]:
             """,
             cutoff,
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
-async def get_overdue_admin() -> List[Dict[str, Any]]:
+async def get_overdue_admin() -> List[asyncpg.Record]:
     """Get overdue admin tasks."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
     today = datetime.now().date()
 
     async with pool.acquire() as conn:
@@ -141,12 +147,49 @@ async def get_overdue_admin() -> List[Dict[str, Any]]:
             """,
             today,
         )
-        return [dict(row) for row in rows]
+        return rows
+
+
+async def get_admin_dashboard(days: int = 7) -> Dict[str, List[asyncpg.Record]]:
+    """Get pending admin tasks bucketed by urgency in a single query.
+
+    Returns a dict with 'overdue', 'due_soon' and 'other' lists; replaces
+    separate get_overdue_admin + get_admin_due_soon round trips for callers
+    that need both.
+    """
+    pool = current_pool() or await get_pool()
+    cutoff = datetime.now().date() + timedelta(days=days)
+
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT id, name, due_date, status, notes,
+                CASE
+                    WHEN due_date < CURRENT_DATE THEN 'overdue'
+                    WHEN due_date <= $1 THEN 'due_soon'
+                    ELSE 'other'
+                END AS bucket
+            FROM admin
+            WHERE status = 'pending'
+              AND due_date IS NOT NULL
+            ORDER BY due_date ASC
+            """,
+            cutoff,
+        )
+
+    buckets: Dict[str, List[asyncpg.Record]] = {
+        "overdue": [],
+        "due_soon": [],
+        "other": [],
+    }
+    for row in rows:
+        buckets[row["bucket"]].append(row)
+    return buckets
 
 
-async def list_admin(due_only: bool = False, limit: int = 20) -> List[Dict[str, Any]]:
+async def list_admin(due_only: bool = False, limit: int = 20) -> List[asyncpg.Record]:
     """List admin tasks."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         if due_only:
@@ -173,7 +216,7 @@ async def list_admin(due_only: bool = False, limit: int = 20) -> List[Dict[str,
                 """,
                 limit,
             )
-        return [dict(row) for row in rows]
+        return rows
 
 
 # =============================================================================
@@ -181,21 +224,22 @@ async def list_admin(due_only: bool = False, limit: int = 20) -> List[Dict[str,
 # =============================================================================
 
 
-async def get_people_with_followups() -> List[Dict[str, Any]]:
+async def get_people_with_followups() -> List[asyncpg.Record]:
     """Get people who have follow-up notes."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         rows = await conn.fetch(
             """
-            SELECT id, name, context, follow_ups, last_touched
+            SELECT id, name, context, follow_ups, last_touched,
+                   to_char(last_touched, 'Mon DD') AS last_touched_md
             FROM people
             WHERE follow_ups IS NOT NULL
               AND follow_ups != ''
             ORDER BY last_touched DESC
             """
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
 # =============================================================================
@@ -203,9 +247,9 @@ async def get_people_with_followups() -> List[Dict[str, Any]]:
 # =============================================================================
 
 
-async def get_recent_ideas(days: int = 7, limit: int = 10) -> List[Dict[str, Any]]:
+async def get_recent_ideas(days: int = 7, limit: int = 10) -> List[asyncpg.Record]:
     """Get ideas captured in the last N days."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
     cutoff = datetime.now() - timedelta(days=days)
 
     async with pool.acquire() as conn:
@@ -220,12 +264,12 @@ async def get_recent_ideas(days: int = 7, limit: int = 10) -> List[Dict[str, Any
             cutoff,
             limit,
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
-async def list_ideas(limit: int = 20) -> List[Dict[str, Any]]:
+async def list_ideas(limit: int = 20) -> List[asyncpg.Record]:
     """List recent ideas."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
 
     async with pool.acquire() as conn:
         rows = await conn.fetch(
@@ -237,7 +281,7 @@ async def list_ideas(limit: int = 20) -> List[Dict[str, Any]]:
             """,
             limit,
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
 # =============================================================================
@@ -245,9 +289,9 @@ async def list_ideas(limit: int = 20) -> List[Dict[str, Any]]:
 # =============================================================================
 
 
-async def get_recent_decisions(days: int = 7, limit: int = 5) -> List[Dict[str, Any]]:
+async def get_recent_decisions(days: int = 7, limit: int = 5) -> List[asyncpg.Record]:
     """Get decisions made in the last N days."""
-    pool = await get_pool()
+    pool = current_pool() or await get_pool()
     cutoff = datetime.now() - timedelta(days=days)
 
     async with pool.acquire() as conn:
@@ -262,7 +306,7 @@ async def get_recent_decisions(days: int = 7, limit: int = 5) -> List[Dict[str,
             cutoff,
             limit,
         )
-        return [dict(row) for row in rows]
+        return rows
 
 
 # =============================================================================
@@ -271,104 +315,246 @@ async def get_recent_decisions(days: int = 7, limit: int = 5) -> List[Dict[str,
 
 
 async def get_inbox_stats(days: int = 7) -> Dict[str, int]:
-    """Get inbox statistics for the last N days."""
-    pool = await get_pool()
-    cutoff = datetime.now() - timedelta(days=days)
+    """Get inbox statistics for the last N days.
+
+    Reads the inbox_stats_daily rollup (maintained by trigger on
+    inbox_log, see schema.sql) instead of aggregating the full log, so
+    cost stays constant as the log grows.
+    """
+    pool = current_pool() or await get_pool()
+    cutoff = (datetime.now() - timedelta(days=days)).date()
 
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
+        rows = await conn.fetch(
             """
-            SELECT
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE status = 'filed') as filed,
-                COUNT(*) FILTER (WHERE status = 'needs_review') as needs_review,
-                COUNT(*) FILTER (WHERE status = 'fixed') as fixed
-            FROM inbox_log
-            WHERE created_at >= $1
+            SELECT status, SUM(count)::bigint AS count
+            FROM inbox_stats_daily
+            WHERE day >= $1
+            GROUP BY status
             """,
             cutoff,
         )
-        return dict(row)
+
+    stats = {"total": 0, "filed": 0, "needs_review": 0, "fixed": 0}
+    for row in rows:
+        if row["status"] in stats:
+            stats[row["status"]] = row["count"]
+        stats["total"] += row["count"]
+    return stats
+
+
+# =============================================================================
+# Weekly Review Bundle
+# =============================================================================
+
+# Everything the weekly review needs, gathered by one statement: a single
+# round trip and one snapshot instead of eight queries. Ordering that the
+# report relies on is enforced inside each json_agg.
+_WEEKLY_REVIEW_SQL = """
+    WITH active AS (
+        SELECT id, name, status, next_action, notes, tags, updated_at,
+               to_char(updated_at, 'Dy') AS updated_dow
+        FROM projects WHERE status = 'active'
+        ORDER BY updated_at DESC LIMIT 20
+    ),
+    waiting AS (
+        SELECT id, name, status, next_action, notes, updated_at,
+               to_char(updated_at, 'Mon DD') AS updated_md
+        FROM projects WHERE status = 'waiting'
+    ),
+    blocked AS (
+        SELECT id, name, status, next_action, notes, updated_at
+        FROM projects WHERE status = 'blocked'
+    ),
+    admin_tasks AS (
+        SELECT id, name, due_date, status, notes,
+            CASE
+                WHEN due_date < CURRENT_DATE THEN 'overdue'
+                WHEN due_date <= $1 THEN 'due_soon'
+                ELSE 'other'
+            END AS bucket
+        FROM admin
+        WHERE status = 'pending' AND due_date IS NOT NULL
+    ),
+    followups AS (
+        SELECT id, name, context, follow_ups, last_touched,
+               to_char(last_touched, 'Mon DD') AS last_touched_md
+        FROM people
+        WHERE follow_ups IS NOT NULL AND follow_ups != ''
+    ),
+    recent_decisions AS (
+        SELECT id, title, decision, rationale, created_at
+        FROM decisions WHERE created_at >= $2
+        ORDER BY created_at DESC LIMIT 10
+    ),
+    recent_ideas AS (
+        SELECT id, title, one_liner, created_at
+        FROM ideas WHERE created_at >= $2
+        ORDER BY created_at DESC LIMIT 10
+    ),
+    stats AS (
+        SELECT status, SUM(count)::bigint AS count
+        FROM inbox_stats_daily WHERE day >= $3
+        GROUP BY status
+    )
+    SELECT json_build_object(
+        'active', (SELECT coalesce(json_agg(row_to_json(a) ORDER BY a.updated_at DESC), '[]'::json) FROM active a),
+        'waiting', (SELECT coalesce(json_agg(row_to_json(w) ORDER BY w.updated_at DESC), '[]'::json) FROM waiting w),
+        'blocked', (SELECT coalesce(json_agg(row_to_json(b) ORDER BY b.updated_at DESC), '[]'::json) FROM blocked b),
+        'overdue', (SELECT coalesce(json_agg(row_to_json(t) ORDER BY t.due_date ASC), '[]'::json) FROM admin_tasks t WHERE t.bucket = 'overdue'),
+        'due_soon', (SELECT coalesce(json_agg(row_to_json(t) ORDER BY t.due_date ASC), '[]'::json) FROM admin_tasks t WHERE t.bucket = 'due_soon'),
+        'people', (SELECT coalesce(json_agg(row_to_json(f) ORDER BY f.last_touched DESC), '[]'::json) FROM followups f),
+        'decisions', (SELECT coalesce(json_agg(row_to_json(d) ORDER BY d.created_at DESC), '[]'::json) FROM recent_decisions d),
+        'ideas', (SELECT coalesce(json_agg(row_to_json(i) ORDER BY i.created_at DESC), '[]'::json) FROM recent_ideas i),
+        'stats', (SELECT coalesce(json_object_agg(s.status, s.count), '{}'::json) FROM stats s)
+    )
+"""
+
+
+async def get_weekly_review_bundle(days: int = 7) -> Dict[str, Any]:
+    """Fetch all weekly-review data in a single query.
+
+    Returns lists under 'active', 'waiting', 'blocked', 'overdue',
+    'due_soon', 'people', 'decisions' and 'ideas', plus the folded
+    'stats' totals.
+    """
+    pool = current_pool() or await get_pool()
+    now = datetime.now()
+    due_cutoff = now.date() + timedelta(days=days)
+    created_cutoff = now - timedelta(days=days)
+
+    async with pool.acquire() as conn:
+        payload = await conn.fetchval(
+            _WEEKLY_REVIEW_SQL, due_cutoff, created_cutoff, created_cutoff.date()
+        )
+
+    bundle = json.loads(payload) if isinstance(payload, str) else payload
+
+    raw_stats = bundle.get("stats") or {}
+    stats = {"total": 0, "filed": 0, "needs_review": 0, "fixed": 0}
+    for status, count in raw_stats.items():
+        if status in stats:
+            stats[status] = count
+        stats["total"] += count
+    bundle["stats"] = stats
+
+    return bundle
 
 
 # =============================================================================
 # Full-Text Search
 # =============================================================================
 
+# Columns returned per searchable table. Matching and ranking use the stored
+# generated search_vector column (see schema.sql), so no per-row tokenization
+# happens at query time and the GIN indexes are usable.
+SEARCH_DISPLAY_COLUMNS = {
+    "people": "id, name, context, follow_ups, last_touched",
+    "projects": "id, name, status, next_action, notes, updated_at",
+    "ideas": "id, title, one_liner, elaboration, created_at",
+    "admin": "id, name, due_date, status, notes, created_at",
+    "decisions": "id, title, decision, rationale, context, created_at",
+    "howtos": "id, title, content, created_at",
+    "snippets": "id, title, content, created_at",
+}
+
+# Build the per-table UNION ALL branches once at import time. Each branch
+# projects its table-specific display columns into a JSON payload so the
+# branches have a uniform (source_table, data, rank) shape. Stable query text
+# also lets asyncpg reuse its per-connection prepared-statement cache instead
+# of re-parsing on every call. The tsquery itself comes from a shared CTE
+# (see _combined_search_sql) so it's computed once per query, not per branch,
+# and websearch_to_tsquery supports quoted phrases and -exclusions.
+SEARCH_SQL = {
+    table: f"""
+        (SELECT
+            '{table}' as source_table,
+            row_to_json((SELECT d FROM (SELECT {columns}) d)) as data,
+            ts_rank_cd(search_vector, q.tq) as rank
+        FROM {table}, q
+        WHERE search_vector @@ q.tq
+        ORDER BY rank DESC
+        LIMIT $2 + $3)
+    """
+    for table, columns in SEARCH_DISPLAY_COLUMNS.items()
+}
+
+# Combined queries, cached per table combination (recall/search/people each
+# use a fixed tuple of tables)
+_COMBINED_SEARCH_SQL: Dict[tuple, str] = {}
+
+# Short-lived result cache for repeated identical searches,
+# keyed on (query, tables, limit)
+_SEARCH_CACHE: Dict[tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+_SEARCH_CACHE_TTL = 60.0
+_SEARCH_CACHE_MAX = 128
+
+
+def _combined_search_sql(tables: tuple) -> str:
+    """Get the UNION ALL query covering the given tables."""
+    sql = _COMBINED_SEARCH_SQL.get(tables)
+    if sql is None:
+        union = " UNION ALL ".join(SEARCH_SQL[t] for t in tables)
+        # Final top-K across tables happens in the DB, so Python never sorts
+        sql = (
+            "WITH q AS (SELECT websearch_to_tsquery('english', $1) AS tq) "
+            f"SELECT * FROM ({union}) s ORDER BY rank DESC LIMIT $2 OFFSET $3"
+        )
+        _COMBINED_SEARCH_SQL[tables] = sql
+    return sql
+
 
 async def search_full_text(
     query: str,
     tables: List[str],
     limit: int = 10,
+    offset: int = 0,
 ) -> List[Dict[str, Any]]:
     """
     Full-text search across specified tables.
-    Returns results with table name and relevance score.
+    Returns results with table name and relevance score; offset skips
+    ranked rows in the database so pagination doesn't over-fetch.
     """
-    pool = await get_pool()
-
-    table_configs = {
-        "people": {
-            "search_columns": "name || ' ' || COALESCE(context, '') || ' ' || COALESCE(follow_ups, '')",
-            "display_columns": "id, name, context, follow_ups, last_touched",
-        },
-        "projects": {
-            "search_columns": "name || ' ' || COALESCE(next_action, '') || ' ' || COALESCE(notes, '')",
-            "display_columns": "id, name, status, next_action, notes, updated_at",
-        },
-        "ideas": {
-            "search_columns": "title || ' ' || COALESCE(one_liner, '') || ' ' || COALESCE(elaboration, '')",
-            "display_columns": "id, title, one_liner, elaboration, created_at",
-        },
-        "admin": {
-            "search_columns": "name || ' ' || COALESCE(notes, '')",
-            "display_columns": "id, name, due_date, status, notes, created_at",
-        },
-        "decisions": {
-            "search_columns": "title || ' ' || decision || ' ' || COALESCE(rationale, '') || ' ' || COALESCE(context, '')",
-            "display_columns": "id, title, decision, rationale, context, created_at",
-        },
-        "howtos": {
-            "search_columns": "title || ' ' || content",
-            "display_columns": "id, title, content, created_at",
-        },
-        "snippets": {
-            "search_columns": "title || ' ' || content",
-            "display_columns": "id, title, content, created_at",
-        },
-    }
-
-    results = []
-
+    # Trivial queries can't match anything useful - skip the DB entirely
+    query = " ".join(query.split())
+    if len(query) < 2:
+        return []
+
+    searchable = tuple(t for t in tables if t in SEARCH_SQL)
+    if not searchable:
+        return []
+
+    cache_key = (query, searchable, limit, offset)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        expires, results = cached
+        if monotonic() < expires:
+            return results
+        del _SEARCH_CACHE[cache_key]
+
+    pool = current_pool() or await get_pool()
+
+    # One UNION ALL query covering all tables: one parse/plan/fetch instead
+    # of one round trip per table, with each branch using its own GIN index
     async with pool.acquire() as conn:
-        for table in tables:
-            if table not in table_configs:
-                continue
-
-            config = table_configs[table]
-
-            sql = f"""
-                SELECT
-                    '{table}' as source_table,
-                    {config['display_columns']},
-                    ts_rank(
-                        to_tsvector('english', {config['search_columns']}),
-                        plainto_tsquery('english', $1)
-                    ) as rank
-                FROM {table}
-                WHERE to_tsvector('english', {config['search_columns']})
-                      @@ plainto_tsquery('english', $1)
-                ORDER BY rank DESC
-                LIMIT $2
-            """
+        rows = await conn.fetch(
+            _combined_search_sql(searchable), query, limit, offset
+        )
 
-            rows = await conn.fetch(sql, query, limit)
-            results.extend([dict(row) for row in rows])
+    results = []
+    for row in rows:
+        data = row["data"]
+        if isinstance(data, str):
+            data = json.loads(data)
+        results.append(
+            {"source_table": row["source_table"], "rank": row["rank"], **data}
+        )
 
-    # Sort all results by rank
-    results.sort(key=lambda x: x.get("rank", 0), reverse=True)
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.clear()
+    _SEARCH_CACHE[cache_key] = (monotonic() + _SEARCH_CACHE_TTL, results)
 
-    return results[:limit]
+    return results
 
 
 async def search_references(query: str, limit: int = 10) -> List[Dict[str, Any]]:
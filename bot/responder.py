@@ -1,8 +1,26 @@
 """Telegram message response helpers."""
 
+import logging
+
 from typing import Optional
 from telegram import Bot
 
+logger = logging.getLogger(__name__)
+
+# Static category menu for clarification prompts, built once instead of
+# re-assembled on every ambiguous message
+_CATEGORY_MENU = (
+    "Reply with one of:\n"
+    "• `person:` - if about a person\n"
+    "• `project:` - if it's a project\n"
+    "• `idea:` - if it's an idea\n"
+    "• `admin:` - if it's a task/errand\n"
+    "• `decision:` - to save as a decision\n"
+    "• `howto:` - to save as a how-to\n"
+    "• `snippet:` - to save as a snippet\n"
+    "• `skip` - to ignore"
+)
+
 
 async def send_confirmation(
     bot: Bot,
@@ -41,32 +59,14 @@ async def send_clarification_request(
 
     if suggested_category and confidence:
         confidence_pct = int(confidence * 100)
-        text = (
+        lead = (
             f"🤔 Not sure about this one.\n"
             f"Best guess: {suggested_category} ({confidence_pct}% confident)\n\n"
-            f"Reply with one of:\n"
-            f"• `person:` - if about a person\n"
-            f"• `project:` - if it's a project\n"
-            f"• `idea:` - if it's an idea\n"
-            f"• `admin:` - if it's a task/errand\n"
-            f"• `decision:` - to save as a decision\n"
-            f"• `howto:` - to save as a how-to\n"
-            f"• `snippet:` - to save as a snippet\n"
-            f"• `skip` - to ignore"
         )
     else:
-        text = (
-            f"❓ I couldn't classify this.\n\n"
-            f"Reply with one of:\n"
-            f"• `person:` - if about a person\n"
-            f"• `project:` - if it's a project\n"
-            f"• `idea:` - if it's an idea\n"
-            f"• `admin:` - if it's a task/errand\n"
-            f"• `decision:` - to save as a decision\n"
-            f"• `howto:` - to save as a how-to\n"
-            f"• `snippet:` - to save as a snippet\n"
-            f"• `skip` - to ignore"
-        )
+        lead = "❓ I couldn't classify this.\n\n"
+
+    text = lead + _CATEGORY_MENU
 
     message = await bot.send_message(
         chat_id=chat_id,
@@ -126,11 +126,13 @@ async def send_message(
 ) -> int:
     """Send a generic message, optionally as a reply."""
 
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.info(f"send_message: Sending message of length {len(text)} chars")
-    logger.info(f"send_message: First 200 chars: {text[:200]}")
-    logger.info(f"send_message: Last 200 chars: {text[-200:]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "send_message len=%d head=%r tail=%r",
+            len(text),
+            text[:200],
+            text[-200:],
+        )
 
     message = await bot.send_message(
         chat_id=chat_id,
@@ -138,6 +140,4 @@ async def send_message(
         reply_to_message_id=reply_to_message_id,
     )
 
-    logger.info(f"send_message: Message sent successfully, message_id={message.message_id}")
-
     return message.message_id
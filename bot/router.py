@@ -1,17 +1,18 @@
 """Message routing logic."""
 
 import logging
+from types import MappingProxyType
 from typing import Tuple, Optional
 
 from classifier import classify_thought, parse_reference
-from bot.db import insert_record, insert_inbox_log
+from bot.db import insert_record_with_log, insert_inbox_log
 from bot.config import Config
 
 logger = logging.getLogger(__name__)
 
 
-# Map categories to table names
-CATEGORY_TABLE_MAP = {
+# Map categories to table names (read-only so accidental mutation fails fast)
+CATEGORY_TABLE_MAP = MappingProxyType({
     "people": "people",
     "projects": "projects",
     "ideas": "ideas",
@@ -19,10 +20,10 @@ CATEGORY_TABLE_MAP = {
     "decisions": "decisions",
     "howtos": "howtos",
     "snippets": "snippets",
-}
+})
 
 # Display names for user-facing messages
-CATEGORY_DISPLAY = {
+CATEGORY_DISPLAY = MappingProxyType({
     "people": "person",
     "projects": "project",
     "ideas": "idea",
@@ -30,7 +31,7 @@ CATEGORY_DISPLAY = {
     "decisions": "decision",
     "howtos": "howto",
     "snippets": "snippet",
-}
+})
 
 
 async def route_message(
@@ -54,12 +55,11 @@ async def route_message(
         table = CATEGORY_TABLE_MAP[category]
         extracted = ref_result["extracted"]
 
-        record_id = await insert_record(table, extracted)
-
-        await insert_inbox_log(
+        record_id = await insert_record_with_log(
+            table,
+            extracted,
             raw_text=text,
             destination=category,
-            record_id=record_id,
             confidence=1.0,  # Prefix = explicit intent = full confidence
             status="filed",
             telegram_message_id=telegram_message_id,
@@ -73,7 +73,7 @@ async def route_message(
         classification = await classify_thought(text)
     except Exception as e:
         # LLM failed - log for review
-        logger.error(f"Classification failed for text '{text[:50]}...': {e}")
+        logger.error("Classification failed for text '%s...': %s", text[:50], e)
         await insert_inbox_log(
             raw_text=text,
             destination=None,
@@ -90,7 +90,7 @@ async def route_message(
     extracted = classification.get("extracted", {})
     tags = classification.get("tags", [])
 
-    logger.info(f"Classification: category={category}, confidence={confidence}, threshold={Config.get_threshold(category) if category else Config.CONFIDENCE_THRESHOLD}")
+    logger.info("Classification: category=%s, confidence=%s, threshold=%s", category, confidence, Config.get_threshold(category) if category else Config.CONFIDENCE_THRESHOLD)
 
     # Add tags to extracted data
     if tags:
@@ -127,12 +127,11 @@ async def route_message(
         )
         return None, None, confidence, "needs_review"
 
-    record_id = await insert_record(table, extracted)
-
-    await insert_inbox_log(
+    record_id = await insert_record_with_log(
+        table,
+        extracted,
         raw_text=text,
         destination=category,
-        record_id=record_id,
         confidence=confidence,
         status="filed",
         telegram_message_id=telegram_message_id,
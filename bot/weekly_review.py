@@ -1,32 +1,25 @@
 """Weekly review generation."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from bot.config import Config
-from queries import (
-    get_active_projects,
-    get_waiting_projects,
-    get_blocked_projects,
-    get_admin_due_soon,
-    get_overdue_admin,
-    get_people_with_followups,
-    get_recent_decisions,
-    get_recent_ideas,
-    get_inbox_stats,
-)
+from queries import get_weekly_review_bundle
 
 
 # Load prompt
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
-    """Load a prompt from the prompts directory."""
+    """Load a prompt from the prompts directory (cached per name)."""
     prompt_file = PROMPTS_DIR / f"{name}.md"
-    if prompt_file.exists():
-        return prompt_file.read_text()
-    raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+    try:
+        return prompt_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
 
 WEEKLY_REVIEW_PROMPT = load_prompt("weekly")
@@ -35,16 +28,18 @@ WEEKLY_REVIEW_PROMPT = load_prompt("weekly")
 async def generate_weekly_review() -> str:
     """Generate the weekly review content."""
 
-    # Gather data
-    active_projects = await get_active_projects(limit=20)
-    waiting_projects = await get_waiting_projects()
-    blocked_projects = await get_blocked_projects()
-    overdue = await get_overdue_admin()
-    due_soon = await get_admin_due_soon(days=7)
-    people = await get_people_with_followups()
-    decisions = await get_recent_decisions(days=7, limit=10)
-    ideas = await get_recent_ideas(days=7, limit=10)
-    stats = await get_inbox_stats(days=7)
+    # Gather data - everything comes back from one bundled query, so the
+    # whole review costs a single round trip and a consistent snapshot
+    bundle = await get_weekly_review_bundle(days=7)
+    active_projects = bundle["active"]
+    waiting_projects = bundle["waiting"]
+    blocked_projects = bundle["blocked"]
+    overdue = bundle["overdue"]
+    due_soon = bundle["due_soon"]
+    people = bundle["people"]
+    decisions = bundle["decisions"]
+    ideas = bundle["ideas"]
+    stats = bundle["stats"]
 
     # Format data for LLM
     data_sections = []
@@ -61,7 +56,7 @@ async def generate_weekly_review() -> str:
     if active_projects:
         projects_text = "\n".join(
             [
-                f"- {p['name']}: {p['next_action'] or 'no next action'} (updated {p['updated_at'].strftime('%a')})"
+                f"- {p['name']}: {p['next_action'] or 'no next action'} (updated {p['updated_dow']})"
                 for p in active_projects[:10]
             ]
         )
@@ -72,7 +67,7 @@ async def generate_weekly_review() -> str:
     if waiting_projects:
         waiting_text = "\n".join(
             [
-                f"- {p['name']}: waiting since {p['updated_at'].strftime('%b %d')}"
+                f"- {p['name']}: waiting since {p['updated_md']}"
                 for p in waiting_projects
             ]
         )
@@ -99,7 +94,7 @@ async def generate_weekly_review() -> str:
     if people:
         people_text = "\n".join(
             [
-                f"- {p['name']}: {p['follow_ups']} (last: {p['last_touched'].strftime('%b %d') if p['last_touched'] else 'never'})"
+                f"- {p['name']}: {p['follow_ups']} (last: {p['last_touched_md'] or 'never'})"
                 for p in people[:5]
             ]
         )
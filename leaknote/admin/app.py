@@ -5,10 +5,11 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from starlette.middleware.gzip import GZipMiddleware
 from bot.db import get_pool, close_pool
 from leaknote.admin.dependencies import get_current_admin
 from leaknote.admin import routes
+from leaknote.admin.templating import templates
 
 
 @asynccontextmanager
@@ -16,6 +17,9 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
     # Startup
     await get_pool()
+    # Warm the template cache so first requests don't pay compile time
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
     yield
     # Shutdown
     await close_pool()
@@ -28,12 +32,13 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Compress text-heavy responses (templated pages, static assets); tiny
+# redirects stay below the threshold and skip the compressor
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="leaknote/admin/static"), name="static")
 
-# Configure templates
-templates = Jinja2Templates(directory="leaknote/admin/templates")
-
 
 # Include routes from routes.py
 app.include_router(routes.router, dependencies=[Depends(get_current_admin)])
@@ -1,5 +1,8 @@
 """FastAPI dependencies for the admin UI."""
 
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 import secrets
@@ -10,6 +13,11 @@ from bot.db import get_pool
 
 security = HTTPBasic()
 
+# Expected credentials, resolved once at import instead of two getenv
+# calls on every request
+_ADMIN_USER = os.getenv("ADMIN_USERNAME", "admin")
+_ADMIN_PASS = os.getenv("ADMIN_PASSWORD", "")
+
 
 async def get_db_pool() -> asyncpg.Pool:
     """Get the database connection pool."""
@@ -20,11 +28,8 @@ def get_current_admin(
     credentials: HTTPBasicCredentials = Depends(security),
 ) -> str:
     """Verify HTTP Basic Auth credentials and return the username."""
-    admin_user = os.getenv("ADMIN_USERNAME", "admin")
-    admin_pass = os.getenv("ADMIN_PASSWORD", "")
-
-    correct_username = secrets.compare_digest(credentials.username, admin_user)
-    correct_password = secrets.compare_digest(credentials.password, admin_pass)
+    correct_username = secrets.compare_digest(credentials.username, _ADMIN_USER)
+    correct_password = secrets.compare_digest(credentials.password, _ADMIN_PASS)
 
     if not (correct_username and correct_password):
         raise HTTPException(
@@ -35,99 +40,135 @@ def get_current_admin(
     return credentials.username
 
 
-# Table configurations for form rendering
+# Table configuration as frozen, slotted dataclasses: attribute access is
+# cheaper than nested dict indexing on the per-request form loops, and the
+# registry can't be mutated by accident.
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """One editable column of a table."""
+
+    name: str
+    label: str
+    type: str
+    required: bool = False
+    options: Tuple[str, ...] = ()
+    default: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class TableConfig:
+    """Rendering and form metadata for one table."""
+
+    display_name: str
+    fields: Tuple[Field, ...]
+    list_columns: Tuple[str, ...]
+    is_markdown: bool
+    fields_by_name: Dict[str, Field]
+    markdown_fields: Tuple[Field, ...]
+
+
+def _table_config(display_name, fields, list_columns, is_markdown=False) -> TableConfig:
+    """Build a TableConfig with its precomputed field lookups."""
+    fields = tuple(fields)
+    return TableConfig(
+        display_name=display_name,
+        fields=fields,
+        list_columns=tuple(list_columns),
+        is_markdown=is_markdown,
+        fields_by_name={f.name: f for f in fields},
+        markdown_fields=tuple(f for f in fields if f.type == "markdown"),
+    )
+
+
 TABLE_CONFIGS = {
-    "people": {
-        "display_name": "People",
-        "fields": [
-            {"name": "name", "label": "Name", "type": "text", "required": True},
-            {"name": "context", "label": "Context", "type": "textarea"},
-            {"name": "follow_ups", "label": "Follow Ups", "type": "textarea"},
-            {"name": "last_touched", "label": "Last Touched", "type": "date"},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+    "people": _table_config(
+        "People",
+        [
+            Field("name", "Name", "text", required=True),
+            Field("context", "Context", "textarea"),
+            Field("follow_ups", "Follow Ups", "textarea"),
+            Field("last_touched", "Last Touched", "date"),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["name", "context", "last_touched", "updated_at"],
-        "is_markdown": False,
-    },
-    "projects": {
-        "display_name": "Projects",
-        "fields": [
-            {"name": "name", "label": "Name", "type": "text", "required": True},
-            {"name": "status", "label": "Status", "type": "select", "options": ["active", "waiting", "blocked", "someday", "done"], "default": "active"},
-            {"name": "next_action", "label": "Next Action", "type": "text"},
-            {"name": "notes", "label": "Notes", "type": "textarea"},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["name", "context", "last_touched", "updated_at"],
+    ),
+    "projects": _table_config(
+        "Projects",
+        [
+            Field("name", "Name", "text", required=True),
+            Field("status", "Status", "select", options=("active", "waiting", "blocked", "someday", "done"), default="active"),
+            Field("next_action", "Next Action", "text"),
+            Field("notes", "Notes", "textarea"),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["name", "status", "next_action", "updated_at"],
-        "is_markdown": False,
-    },
-    "ideas": {
-        "display_name": "Ideas",
-        "fields": [
-            {"name": "title", "label": "Title", "type": "text", "required": True},
-            {"name": "one_liner", "label": "One Liner", "type": "text"},
-            {"name": "elaboration", "label": "Elaboration", "type": "textarea"},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["name", "status", "next_action", "updated_at"],
+    ),
+    "ideas": _table_config(
+        "Ideas",
+        [
+            Field("title", "Title", "text", required=True),
+            Field("one_liner", "One Liner", "text"),
+            Field("elaboration", "Elaboration", "textarea"),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["title", "one_liner", "created_at", "updated_at"],
-        "is_markdown": False,
-    },
-    "admin": {
-        "display_name": "Admin",
-        "fields": [
-            {"name": "name", "label": "Name", "type": "text", "required": True},
-            {"name": "due_date", "label": "Due Date", "type": "date"},
-            {"name": "status", "label": "Status", "type": "select", "options": ["pending", "done"], "default": "pending"},
-            {"name": "notes", "label": "Notes", "type": "textarea"},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["title", "one_liner", "created_at", "updated_at"],
+    ),
+    "admin": _table_config(
+        "Admin",
+        [
+            Field("name", "Name", "text", required=True),
+            Field("due_date", "Due Date", "date"),
+            Field("status", "Status", "select", options=("pending", "done"), default="pending"),
+            Field("notes", "Notes", "textarea"),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["name", "due_date", "status", "updated_at"],
-        "is_markdown": False,
-    },
-    "decisions": {
-        "display_name": "Decisions",
-        "fields": [
-            {"name": "title", "label": "Title", "type": "text", "required": True},
-            {"name": "decision", "label": "Decision", "type": "markdown", "required": True},
-            {"name": "rationale", "label": "Rationale", "type": "markdown"},
-            {"name": "context", "label": "Context", "type": "markdown"},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["name", "due_date", "status", "updated_at"],
+    ),
+    "decisions": _table_config(
+        "Decisions",
+        [
+            Field("title", "Title", "text", required=True),
+            Field("decision", "Decision", "markdown", required=True),
+            Field("rationale", "Rationale", "markdown"),
+            Field("context", "Context", "markdown"),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["title", "decision", "created_at"],
-        "is_markdown": True,
-    },
-    "howtos": {
-        "display_name": "How-Tos",
-        "fields": [
-            {"name": "title", "label": "Title", "type": "text", "required": True},
-            {"name": "content", "label": "Content", "type": "markdown", "required": True},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["title", "decision", "created_at"],
+        is_markdown=True,
+    ),
+    "howtos": _table_config(
+        "How-Tos",
+        [
+            Field("title", "Title", "text", required=True),
+            Field("content", "Content", "markdown", required=True),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["title", "created_at", "updated_at"],
-        "is_markdown": True,
-    },
-    "snippets": {
-        "display_name": "Snippets",
-        "fields": [
-            {"name": "title", "label": "Title", "type": "text", "required": True},
-            {"name": "content", "label": "Content", "type": "markdown", "required": True},
-            {"name": "tags", "label": "Tags", "type": "tags"},
+        ["title", "created_at", "updated_at"],
+        is_markdown=True,
+    ),
+    "snippets": _table_config(
+        "Snippets",
+        [
+            Field("title", "Title", "text", required=True),
+            Field("content", "Content", "markdown", required=True),
+            Field("tags", "Tags", "tags"),
         ],
-        "list_columns": ["title", "created_at", "updated_at"],
-        "is_markdown": True,
-    },
-    "pending_clarifications": {
-        "display_name": "Pending Clarifications",
-        "fields": [],
-        "list_columns": ["telegram_message_id", "suggested_category", "created_at"],
-        "is_markdown": False,
-    },
+        ["title", "created_at", "updated_at"],
+        is_markdown=True,
+    ),
+    "pending_clarifications": _table_config(
+        "Pending Clarifications",
+        [],
+        ["telegram_message_id", "suggested_category", "created_at"],
+    ),
 }
 
 VALID_TABLES = list(TABLE_CONFIGS.keys())
 
 
-def get_table_config(table_name: str) -> dict:
+def get_table_config(table_name: str) -> TableConfig:
     """Get configuration for a table."""
     if table_name not in TABLE_CONFIGS:
         raise HTTPException(
@@ -1,10 +1,13 @@
 """Admin UI routes for the Leaknote admin interface."""
 
-from datetime import datetime, date
+import asyncio
+import json
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from time import monotonic
 from typing import Optional
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from markdown import markdown
 import asyncpg
 
@@ -12,15 +15,116 @@ from bot.db import get_pool, insert_record, update_record, delete_record, get_re
 from bot.queries import (
     get_inbox_stats,
     get_active_projects,
-    get_admin_due_soon,
-    get_overdue_admin,
+    get_admin_dashboard,
     get_people_with_followups,
     get_recent_ideas,
 )
 from leaknote.admin.dependencies import get_db_pool, get_table_config, VALID_TABLES
+from leaknote.admin.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="leaknote/admin/templates")
+
+# Tables shown with record counts on the dashboard
+COUNT_TABLES = ["people", "projects", "ideas", "admin", "decisions", "howtos", "snippets"]
+
+# Listing statements built once per table so every request executes the
+# same query text and hits asyncpg's per-connection prepared-statement
+# cache without re-rendering the f-string
+_LIST_OFFSET_SQL = {
+    t: (
+        f"SELECT *, COUNT(*) OVER() AS __total FROM {t} "
+        "ORDER BY created_at DESC, id DESC LIMIT $1 OFFSET $2"
+    )
+    for t in VALID_TABLES
+}
+_LIST_KEYSET_SQL = {
+    t: (
+        f"SELECT *, COUNT(*) OVER() AS __total FROM {t} "
+        "WHERE (created_at, id) < ($1, $2) "
+        "ORDER BY created_at DESC, id DESC LIMIT $3"
+    )
+    for t in VALID_TABLES
+}
+
+async def _get_table_counts(pool: asyncpg.Pool) -> dict:
+    """Fetch approximate per-table row counts in one catalog lookup.
+
+    The dashboard tiles tolerate estimates, so use pg_class.reltuples
+    instead of seven exact COUNT(*) scans. reltuples is -1 for tables
+    that were never analyzed, hence the GREATEST. table_list keeps the
+    exact count for the table being viewed.
+    """
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT relname, GREATEST(reltuples, 0)::bigint AS count
+            FROM pg_class
+            WHERE relkind = 'r' AND relname = ANY($1::text[])
+            """,
+            COUNT_TABLES,
+        )
+    counts = {row["relname"]: row["count"] for row in rows}
+    # Keep every tile present even if a table is missing from the catalog
+    return {t: counts.get(t, 0) for t in COUNT_TABLES}
+
+
+# Dashboard data cache: single-user system, so a short TTL removes all DB
+# traffic on repeated loads. Writes invalidate it explicitly.
+_DASHBOARD_CACHE: dict = {}
+_DASHBOARD_TTL = 60.0
+
+
+def _invalidate_dashboard_cache() -> None:
+    """Drop cached dashboard data after any write."""
+    _DASHBOARD_CACHE.clear()
+
+
+# Converters for field types that need more than the raw string
+_FIELD_PARSERS = {
+    "tags": lambda v: [t.strip() for t in v.split(",") if t.strip()],
+}
+
+
+def _parse_form_data(config, form_data) -> dict:
+    """Extract submitted values for a table's fields.
+
+    Materializes the multidict once instead of scanning it per field,
+    and dispatches conversion by field type.
+    """
+    raw = dict(form_data)
+    data = {}
+    for field in config.fields:
+        value = raw.get(field.name)
+        if value is None or value == "":
+            continue
+        parser = _FIELD_PARSERS.get(field.type)
+        data[field.name] = parser(value) if parser else value
+    return data
+
+
+@lru_cache(maxsize=1024)
+def _render_markdown(text: str) -> str:
+    """Render markdown to HTML, cached on the source text.
+
+    Reference records rarely change, so repeat views skip the parse.
+    """
+    return markdown(text)
+
+
+def _prerender_markdown(config, data: dict) -> Optional[str]:
+    """Render a table's markdown fields once at write time.
+
+    Returns a JSON map of field name -> HTML for markdown tables, so
+    record_view can serve stored HTML instead of re-parsing on each GET.
+    """
+    if not config.is_markdown:
+        return None
+    rendered = {
+        field.name: _render_markdown(data[field.name])
+        for field in config.markdown_fields
+        if data.get(field.name)
+    }
+    return json.dumps(rendered) if rendered else None
 
 
 # =============================================================================
@@ -34,32 +138,41 @@ async def dashboard(
     pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Dashboard with statistics and quick links."""
-    stats = await get_inbox_stats(days=7)
-    active_projects = await get_active_projects(limit=5)
-    due_soon = await get_admin_due_soon(days=7)
-    overdue = await get_overdue_admin()
-    followups = await get_people_with_followups()
-    recent_ideas = await get_recent_ideas(days=7, limit=5)
-
-    # Get record counts per table
-    counts = {}
-    async with pool.acquire() as conn:
-        for table in ["people", "projects", "ideas", "admin", "decisions", "howtos", "snippets"]:
-            count = await conn.fetchval(f"SELECT COUNT(*) FROM {table}")
-            counts[table] = count
-
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
+    cached = _DASHBOARD_CACHE.get("data")
+    if cached is not None and monotonic() < cached[0]:
+        data = cached[1]
+    else:
+        # All queries are independent - fan them out on the pool instead of
+        # paying the round trips serially
+        (
+            stats,
+            active_projects,
+            admin_buckets,
+            followups,
+            recent_ideas,
+            counts,
+        ) = await asyncio.gather(
+            get_inbox_stats(days=7),
+            get_active_projects(limit=5),
+            get_admin_dashboard(days=7),
+            get_people_with_followups(),
+            get_recent_ideas(days=7, limit=5),
+            _get_table_counts(pool),
+        )
+        data = {
             "stats": stats,
             "active_projects": active_projects,
-            "due_soon": due_soon,
-            "overdue": overdue,
+            "due_soon": admin_buckets["due_soon"],
+            "overdue": admin_buckets["overdue"],
             "followups": followups,
             "recent_ideas": recent_ideas,
             "counts": counts,
-        },
+        }
+        _DASHBOARD_CACHE["data"] = (monotonic() + _DASHBOARD_TTL, data)
+
+    return templates.TemplateResponse(
+        "dashboard.html",
+        {"request": request, **data},
     )
 
 
@@ -76,33 +189,72 @@ async def table_list(
     page: int = 1,
     per_page: int = 20,
     search: Optional[str] = None,
+    after_ts: Optional[str] = None,
+    after_id: Optional[str] = None,
 ):
     """List records from a table with pagination."""
     config = get_table_config(table_name)
 
     offset = (page - 1) * per_page
 
+    # Keyset cursor from the previous page, if present. Deep OFFSETs make
+    # PostgreSQL scan and discard every skipped row; seeking on
+    # (created_at, id) keeps page-N cost independent of N.
+    cursor = None
+    if after_ts and after_id:
+        try:
+            cursor = (datetime.fromisoformat(after_ts), after_id)
+        except ValueError:
+            cursor = None
+
     # Build query
     if search and table_name in ["people", "projects", "ideas", "admin", "decisions", "howtos", "snippets"]:
-        # Use full-text search
+        # Use full-text search; offset is applied in the database so only
+        # one page of rows crosses the wire
         from bot.queries import search_full_text
-        results = await search_full_text(search, [table_name], limit=per_page * 2)
-        records = results[offset : offset + per_page]
-        total = len(results)
+        records = await search_full_text(
+            search, [table_name], limit=per_page, offset=offset
+        )
+        total = offset + len(records)
+        if len(records) == per_page:
+            # A full page means there may be more - make the Next link show
+            total += 1
     else:
-        # Simple pagination
+        # One round trip: the window aggregate returns the total over the
+        # same scan as the page rows
         async with pool.acquire() as conn:
-            columns = config["list_columns"]
-            query = f"SELECT * FROM {table_name} ORDER BY created_at DESC LIMIT $1 OFFSET $2"
-            rows = await conn.fetch(query, per_page, offset)
-            records = [dict(r) for r in rows]
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM {table_name}"
-            total = await conn.fetchval(count_query)
+            if cursor:
+                rows = await conn.fetch(
+                    _LIST_KEYSET_SQL[table_name], cursor[0], cursor[1], per_page
+                )
+            else:
+                rows = await conn.fetch(
+                    _LIST_OFFSET_SQL[table_name], per_page, offset
+                )
+
+        # With a cursor the window count covers only the remaining rows;
+        # rows already walked are (page - 1) * per_page
+        total = rows[0]["__total"] if rows else 0
+        if cursor:
+            total += offset
+
+        records = []
+        for r in rows:
+            record = dict(r)
+            record.pop("__total", None)
+            records.append(record)
 
     total_pages = (total + per_page - 1) // per_page
 
+    # Next-page cursor for the template's "Next" link
+    next_after_ts = None
+    next_after_id = None
+    if not search and records:
+        last = records[-1]
+        if last.get("created_at") is not None:
+            next_after_ts = last["created_at"].isoformat()
+            next_after_id = str(last["id"])
+
     return templates.TemplateResponse(
         "table_list.html",
         {
@@ -115,6 +267,8 @@ async def table_list(
             "total": total,
             "total_pages": total_pages,
             "search": search,
+            "next_after_ts": next_after_ts,
+            "next_after_id": next_after_id,
         },
     )
 
@@ -128,7 +282,6 @@ async def table_list(
 async def record_new_form(
     request: Request,
     table_name: str,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Show form to create a new record."""
     config = get_table_config(table_name)
@@ -148,25 +301,19 @@ async def record_new_form(
 async def record_create(
     table_name: str,
     request: Request,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Create a new record."""
     config = get_table_config(table_name)
 
-    form_data = await request.form()
-    data = {}
+    data = _parse_form_data(config, await request.form())
 
-    for field in config["fields"]:
-        value = form_data.get(field["name"])
-        if value is not None and value != "":
-            # Handle tags (comma-separated)
-            if field["type"] == "tags":
-                data[field["name"]] = [t.strip() for t in value.split(",") if t.strip()]
-            else:
-                data[field["name"]] = value
+    rendered_html = _prerender_markdown(config, data)
+    if rendered_html:
+        data["rendered_html"] = rendered_html
 
     try:
         record_id = await insert_record(table_name, data)
+        _invalidate_dashboard_cache()
         return RedirectResponse(f"/table/{table_name}?msg=created", status_code=303)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -182,7 +329,6 @@ async def record_edit_form(
     request: Request,
     table_name: str,
     id: str,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Show form to edit a record."""
     config = get_table_config(table_name)
@@ -208,29 +354,20 @@ async def record_update(
     table_name: str,
     id: str,
     request: Request,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Update a record."""
     config = get_table_config(table_name)
 
-    form_data = await request.form()
-    data = {}
+    data = _parse_form_data(config, await request.form())
 
-    for field in config["fields"]:
-        value = form_data.get(field["name"])
-        if value is not None and value != "":
-            # Handle tags (comma-separated)
-            if field["type"] in ("tags", "select"):
-                if field["type"] == "tags":
-                    data[field["name"]] = [t.strip() for t in value.split(",") if t.strip()]
-                else:
-                    data[field["name"]] = value
-            else:
-                data[field["name"]] = value
+    rendered_html = _prerender_markdown(config, data)
+    if rendered_html:
+        data["rendered_html"] = rendered_html
 
     try:
         success = await update_record(table_name, id, data)
         if success:
+            _invalidate_dashboard_cache()
             return RedirectResponse(f"/table/{table_name}?msg=updated", status_code=303)
         else:
             raise HTTPException(status_code=404, detail="Record not found")
@@ -248,7 +385,6 @@ async def record_view(
     request: Request,
     table_name: str,
     id: str,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """View a record with rendered markdown."""
     config = get_table_config(table_name)
@@ -257,12 +393,18 @@ async def record_view(
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
 
-    # Render markdown fields
+    # Serve HTML rendered at write time; any field missing from the
+    # stored map (rows written before the rendered_html column, forms
+    # that omitted an optional field) falls back to rendering the raw
+    # column, which stays authoritative
     rendered = {}
-    if config["is_markdown"]:
-        for field in config["fields"]:
-            if field["type"] == "markdown" and record.get(field["name"]):
-                rendered[field["name"]] = markdown(record[field["name"]])
+    if config.is_markdown:
+        stored = record.get("rendered_html")
+        if stored:
+            rendered = json.loads(stored) if isinstance(stored, str) else stored
+        for field in config.markdown_fields:
+            if field.name not in rendered and record.get(field.name):
+                rendered[field.name] = _render_markdown(record[field.name])
 
     return templates.TemplateResponse(
         "record_view.html",
@@ -285,11 +427,11 @@ async def record_view(
 async def record_delete(
     table_name: str,
     id: str,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Delete a record."""
     success = await delete_record(table_name, id)
     if success:
+        _invalidate_dashboard_cache()
         return RedirectResponse(f"/table/{table_name}?msg=deleted", status_code=303)
     else:
         raise HTTPException(status_code=404, detail="Record not found")
@@ -303,7 +445,6 @@ async def record_delete(
 @router.get("/bulk-delete", response_class=HTMLResponse)
 async def bulk_delete_form(
     request: Request,
-    pool: asyncpg.Pool = Depends(get_db_pool),
 ):
     """Show bulk delete form."""
     return templates.TemplateResponse(
@@ -333,10 +474,33 @@ async def bulk_delete_execute(
     if table_name not in VALID_TABLES:
         raise HTTPException(status_code=400, detail="Invalid table")
 
-    async with pool.acquire() as conn:
-        result = await conn.execute(
-            f"DELETE FROM {table_name} WHERE created_at < NOW() - INTERVAL '{days} days'"
-        )
-        deleted_count = int(result.split()[-1])
+    cutoff = datetime.now() - timedelta(days=days)
 
+    # Delete in bounded batches so a large purge doesn't hold row locks on
+    # the whole table at once; the cutoff is a parameter, not interpolated
+    batch_size = 1000
+    deleted_count = 0
+    async with pool.acquire() as conn:
+        while True:
+            batch = await conn.fetchval(
+                f"""
+                WITH d AS (
+                    DELETE FROM {table_name}
+                    WHERE ctid IN (
+                        SELECT ctid FROM {table_name}
+                        WHERE created_at < $1
+                        LIMIT $2
+                    )
+                    RETURNING 1
+                )
+                SELECT count(*) FROM d
+                """,
+                cutoff,
+                batch_size,
+            )
+            deleted_count += batch
+            if batch < batch_size:
+                break
+
+    _invalidate_dashboard_cache()
     return RedirectResponse(f"/bulk-delete?msg=deleted_{deleted_count}", status_code=303)
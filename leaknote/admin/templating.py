@@ -0,0 +1,19 @@
+"""Shared Jinja2 template configuration for the admin UI."""
+
+import tempfile
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+TEMPLATES_DIR = "leaknote/admin/templates"
+
+# Cache compiled template bytecode on disk so templates compile once per
+# machine instead of once per worker process, and skip the per-request
+# mtime check since templates only change on deploy.
+_BYTECODE_CACHE_DIR = Path(tempfile.gettempdir()) / "leaknote_jinja"
+_BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
+
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(_BYTECODE_CACHE_DIR))
+templates.env.auto_reload = False
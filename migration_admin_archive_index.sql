@@ -0,0 +1,9 @@
+-- Migration: partial index for the weekly archive of done admin tasks
+-- Run against an existing leaknote database; schema.sql already includes
+-- this index for fresh installs.
+
+\c leaknote
+
+CREATE INDEX IF NOT EXISTS idx_admin_done_updated
+    ON admin(updated_at)
+    WHERE status = 'done';
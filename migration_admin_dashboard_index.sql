@@ -0,0 +1,9 @@
+-- Migration: partial index for the pending-admin dashboard query
+-- Run against an existing leaknote database; schema.sql already includes
+-- this index for fresh installs.
+
+\c leaknote
+
+CREATE INDEX IF NOT EXISTS idx_admin_pending_due
+    ON admin(due_date)
+    WHERE status = 'pending';
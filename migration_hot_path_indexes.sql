@@ -0,0 +1,19 @@
+-- Migration: indexes for the digest/review hot-path predicates
+-- Run against an existing leaknote database; schema.sql already includes
+-- these indexes for fresh installs.
+
+\c leaknote
+
+-- People with follow-ups (small subset; partial index keeps it tiny)
+CREATE INDEX IF NOT EXISTS idx_people_followups
+    ON people(last_touched DESC)
+    WHERE follow_ups IS NOT NULL AND follow_ups <> '';
+
+-- Recent ideas / decisions (created_at >= cutoff ORDER BY created_at DESC)
+CREATE INDEX IF NOT EXISTS idx_ideas_created ON ideas(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_decisions_created ON decisions(created_at DESC);
+
+-- Inbox stats window; lets the COUNT(*) FILTER query run as an
+-- index-only scan
+CREATE INDEX IF NOT EXISTS idx_inbox_log_created_status
+    ON inbox_log(created_at, status);
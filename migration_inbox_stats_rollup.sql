@@ -0,0 +1,47 @@
+-- Migration: daily rollup for inbox stats
+-- Creates inbox_stats_daily plus its maintenance trigger and backfills it
+-- from the existing log. schema.sql already includes these for fresh
+-- installs.
+
+\c leaknote
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS inbox_stats_daily (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE OR REPLACE FUNCTION inbox_stats_daily_maintain() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.status = OLD.status THEN
+            RETURN NEW;
+        END IF;
+        UPDATE inbox_stats_daily
+        SET count = count - 1
+        WHERE day = OLD.created_at::date AND status = OLD.status;
+    END IF;
+    INSERT INTO inbox_stats_daily (day, status, count)
+    VALUES (NEW.created_at::date, NEW.status, 1)
+    ON CONFLICT (day, status) DO UPDATE
+        SET count = inbox_stats_daily.count + 1;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_inbox_stats_daily ON inbox_log;
+CREATE TRIGGER trg_inbox_stats_daily
+    AFTER INSERT OR UPDATE OF status ON inbox_log
+    FOR EACH ROW EXECUTE FUNCTION inbox_stats_daily_maintain();
+
+-- Backfill from the existing log
+TRUNCATE inbox_stats_daily;
+INSERT INTO inbox_stats_daily (day, status, count)
+SELECT created_at::date, status, COUNT(*)
+FROM inbox_log
+GROUP BY created_at::date, status;
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Migration: composite indexes for keyset pagination in the admin UI
+-- Run against an existing leaknote database; schema.sql already includes
+-- these indexes for fresh installs.
+
+\c leaknote
+
+CREATE INDEX IF NOT EXISTS idx_people_keyset ON people(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_keyset ON projects(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_ideas_keyset ON ideas(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_admin_keyset ON admin(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_decisions_keyset ON decisions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_howtos_keyset ON howtos(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_snippets_keyset ON snippets(created_at DESC, id DESC);
@@ -0,0 +1,15 @@
+-- Make pending_clarifications.telegram_message_id unique so the bot can
+-- upsert clarifications (INSERT ... ON CONFLICT) instead of delete + insert.
+
+BEGIN;
+
+-- Remove any duplicate rows, keeping the most recent per message
+DELETE FROM pending_clarifications pc
+USING pending_clarifications newer
+WHERE pc.telegram_message_id = newer.telegram_message_id
+  AND pc.created_at < newer.created_at;
+
+DROP INDEX IF EXISTS idx_pending_telegram_message;
+CREATE UNIQUE INDEX idx_pending_telegram_message ON pending_clarifications(telegram_message_id);
+
+COMMIT;
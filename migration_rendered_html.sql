@@ -0,0 +1,10 @@
+-- Migration: pre-rendered markdown for reference categories
+-- Adds a rendered_html map populated at write time by the admin UI;
+-- schema.sql already includes the column for fresh installs. Existing
+-- rows stay NULL and the record view falls back to rendering on read.
+
+\c leaknote
+
+ALTER TABLE decisions ADD COLUMN IF NOT EXISTS rendered_html JSONB;
+ALTER TABLE howtos ADD COLUMN IF NOT EXISTS rendered_html JSONB;
+ALTER TABLE snippets ADD COLUMN IF NOT EXISTS rendered_html JSONB;
@@ -0,0 +1,41 @@
+-- Precomputed search vectors: replace per-query to_tsvector() recomputation
+-- with STORED generated tsvector columns backed by GIN indexes.
+
+BEGIN;
+
+ALTER TABLE people ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(context, '')), 'B') || setweight(to_tsvector('english', coalesce(follow_ups, '')), 'C')) STORED;
+DROP INDEX IF EXISTS idx_people_fts;
+CREATE INDEX idx_people_fts ON people USING gin(search_vector);
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(next_action, '')), 'B') || setweight(to_tsvector('english', coalesce(notes, '')), 'C')) STORED;
+DROP INDEX IF EXISTS idx_projects_fts;
+CREATE INDEX idx_projects_fts ON projects USING gin(search_vector);
+
+ALTER TABLE ideas ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(one_liner, '')), 'B') || setweight(to_tsvector('english', coalesce(elaboration, '')), 'C')) STORED;
+DROP INDEX IF EXISTS idx_ideas_fts;
+CREATE INDEX idx_ideas_fts ON ideas USING gin(search_vector);
+
+ALTER TABLE admin ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(notes, '')), 'B')) STORED;
+DROP INDEX IF EXISTS idx_admin_fts;
+CREATE INDEX idx_admin_fts ON admin USING gin(search_vector);
+
+ALTER TABLE decisions ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(decision, '')), 'B') || setweight(to_tsvector('english', coalesce(rationale, '')), 'C') || setweight(to_tsvector('english', coalesce(context, '')), 'D')) STORED;
+DROP INDEX IF EXISTS idx_decisions_fts;
+CREATE INDEX idx_decisions_fts ON decisions USING gin(search_vector);
+
+ALTER TABLE howtos ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED;
+DROP INDEX IF EXISTS idx_howtos_fts;
+CREATE INDEX idx_howtos_fts ON howtos USING gin(search_vector);
+
+ALTER TABLE snippets ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED;
+DROP INDEX IF EXISTS idx_snippets_fts;
+CREATE INDEX idx_snippets_fts ON snippets USING gin(search_vector);
+
+COMMIT;
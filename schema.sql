@@ -17,6 +17,8 @@ CREATE TABLE people (
     follow_ups TEXT,
     last_touched TIMESTAMP WITH TIME ZONE,
     tags TEXT[],
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(context, '')), 'B') || setweight(to_tsvector('english', coalesce(follow_ups, '')), 'C')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -28,6 +30,8 @@ CREATE TABLE projects (
     next_action TEXT,
     notes TEXT,
     tags TEXT[],
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(next_action, '')), 'B') || setweight(to_tsvector('english', coalesce(notes, '')), 'C')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -38,6 +42,8 @@ CREATE TABLE ideas (
     one_liner TEXT,
     elaboration TEXT,
     tags TEXT[],
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(one_liner, '')), 'B') || setweight(to_tsvector('english', coalesce(elaboration, '')), 'C')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -49,6 +55,8 @@ CREATE TABLE admin (
     status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'done')),
     notes TEXT,
     tags TEXT[],
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(name, '')), 'A') || setweight(to_tsvector('english', coalesce(notes, '')), 'B')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -64,6 +72,9 @@ CREATE TABLE decisions (
     rationale TEXT,
     context TEXT,
     tags TEXT[],
+    rendered_html JSONB,
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(decision, '')), 'B') || setweight(to_tsvector('english', coalesce(rationale, '')), 'C') || setweight(to_tsvector('english', coalesce(context, '')), 'D')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -72,6 +83,9 @@ CREATE TABLE howtos (
     title TEXT NOT NULL,
     content TEXT NOT NULL,
     tags TEXT[],
+    rendered_html JSONB,
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -81,6 +95,9 @@ CREATE TABLE snippets (
     title TEXT NOT NULL,
     content TEXT NOT NULL,
     tags TEXT[],
+    rendered_html JSONB,
+    search_vector tsvector GENERATED ALWAYS AS
+        (setweight(to_tsvector('english', coalesce(title, '')), 'A') || setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -101,6 +118,37 @@ CREATE TABLE inbox_log (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Daily rollup of inbox_log counts, maintained by trigger so stats
+-- queries never scan the full log
+CREATE TABLE inbox_stats_daily (
+    day DATE NOT NULL,
+    status TEXT NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status)
+);
+
+CREATE OR REPLACE FUNCTION inbox_stats_daily_maintain() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.status = OLD.status THEN
+            RETURN NEW;
+        END IF;
+        UPDATE inbox_stats_daily
+        SET count = count - 1
+        WHERE day = OLD.created_at::date AND status = OLD.status;
+    END IF;
+    INSERT INTO inbox_stats_daily (day, status, count)
+    VALUES (NEW.created_at::date, NEW.status, 1)
+    ON CONFLICT (day, status) DO UPDATE
+        SET count = inbox_stats_daily.count + 1;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_inbox_stats_daily
+    AFTER INSERT OR UPDATE OF status ON inbox_log
+    FOR EACH ROW EXECUTE FUNCTION inbox_stats_daily_maintain();
+
 CREATE TABLE pending_clarifications (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     inbox_log_id UUID REFERENCES inbox_log(id) ON DELETE CASCADE,
@@ -114,22 +162,41 @@ CREATE TABLE pending_clarifications (
 -- Indexes
 -- =============================================================================
 
--- Full-text search indexes
-CREATE INDEX idx_people_fts ON people USING gin(to_tsvector('english', name || ' ' || COALESCE(context, '') || ' ' || COALESCE(follow_ups, '')));
-CREATE INDEX idx_projects_fts ON projects USING gin(to_tsvector('english', name || ' ' || COALESCE(next_action, '') || ' ' || COALESCE(notes, '')));
-CREATE INDEX idx_ideas_fts ON ideas USING gin(to_tsvector('english', title || ' ' || COALESCE(one_liner, '') || ' ' || COALESCE(elaboration, '')));
-CREATE INDEX idx_admin_fts ON admin USING gin(to_tsvector('english', name || ' ' || COALESCE(notes, '')));
-CREATE INDEX idx_decisions_fts ON decisions USING gin(to_tsvector('english', title || ' ' || decision || ' ' || COALESCE(rationale, '')));
-CREATE INDEX idx_howtos_fts ON howtos USING gin(to_tsvector('english', title || ' ' || content));
-CREATE INDEX idx_snippets_fts ON snippets USING gin(to_tsvector('english', title || ' ' || content));
+-- Full-text search indexes (over the stored generated search_vector columns)
+CREATE INDEX idx_people_fts ON people USING gin(search_vector);
+CREATE INDEX idx_projects_fts ON projects USING gin(search_vector);
+CREATE INDEX idx_ideas_fts ON ideas USING gin(search_vector);
+CREATE INDEX idx_admin_fts ON admin USING gin(search_vector);
+CREATE INDEX idx_decisions_fts ON decisions USING gin(search_vector);
+CREATE INDEX idx_howtos_fts ON howtos USING gin(search_vector);
+CREATE INDEX idx_snippets_fts ON snippets USING gin(search_vector);
 
 -- Status and date indexes
 CREATE INDEX idx_projects_status ON projects(status);
 CREATE INDEX idx_admin_status ON admin(status);
 CREATE INDEX idx_admin_due_date ON admin(due_date);
+-- Partial index serving the pending-tasks dashboard query
+CREATE INDEX idx_admin_pending_due ON admin(due_date) WHERE status = 'pending';
+CREATE INDEX idx_admin_done_updated ON admin(updated_at) WHERE status = 'done';
 CREATE INDEX idx_inbox_log_status ON inbox_log(status);
+CREATE INDEX idx_inbox_log_created_status ON inbox_log(created_at, status);
+
+-- Keyset pagination order for the admin list views
+CREATE INDEX idx_people_keyset ON people(created_at DESC, id DESC);
+CREATE INDEX idx_projects_keyset ON projects(created_at DESC, id DESC);
+CREATE INDEX idx_ideas_keyset ON ideas(created_at DESC, id DESC);
+CREATE INDEX idx_admin_keyset ON admin(created_at DESC, id DESC);
+CREATE INDEX idx_decisions_keyset ON decisions(created_at DESC, id DESC);
+CREATE INDEX idx_howtos_keyset ON howtos(created_at DESC, id DESC);
+CREATE INDEX idx_snippets_keyset ON snippets(created_at DESC, id DESC);
+
+-- Hot-path indexes for digest/review queries
+CREATE INDEX idx_people_followups ON people(last_touched DESC)
+    WHERE follow_ups IS NOT NULL AND follow_ups <> '';
+CREATE INDEX idx_ideas_created ON ideas(created_at DESC);
+CREATE INDEX idx_decisions_created ON decisions(created_at DESC);
 CREATE INDEX idx_inbox_log_telegram_message ON inbox_log(telegram_message_id);
-CREATE INDEX idx_pending_telegram_message ON pending_clarifications(telegram_message_id);
+CREATE UNIQUE INDEX idx_pending_telegram_message ON pending_clarifications(telegram_message_id);
 
 -- =============================================================================
 -- Permissions
@@ -0,0 +1,35 @@
+"""Shared Telegram delivery for the cron scripts."""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add bot directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+async def send_to_owner(text: str):
+    """Send a message to the configured owner chat.
+
+    The Telegram SDK is imported lazily so missing config fails fast
+    without paying its import cost first.
+    """
+    if not Config.TELEGRAM_BOT_TOKEN:
+        logger.error("TELEGRAM_BOT_TOKEN not set")
+        sys.exit(1)
+
+    if not Config.TELEGRAM_OWNER_ID:
+        logger.error("TELEGRAM_OWNER_ID not set")
+        sys.exit(1)
+
+    from telegram import Bot
+
+    bot = Bot(token=Config.TELEGRAM_BOT_TOKEN)
+    await bot.send_message(
+        chat_id=Config.TELEGRAM_OWNER_ID,
+        text=text,
+    )
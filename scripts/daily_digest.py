@@ -15,8 +15,7 @@ from pathlib import Path
 # Add bot directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
 
-from telegram import Bot
-from config import Config
+from _send import send_to_owner
 from digest import generate_daily_digest, format_digest_date
 from db import close_pool
 
@@ -27,40 +26,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def send_digest(bot: Bot, chat_id: int, content: str):
-    """Send the daily digest to the owner."""
-    date_str = format_digest_date()
-    full_message = f"☀️ **Daily Digest - {date_str}**\n\n{content}"
-
-    await bot.send_message(
-        chat_id=chat_id,
-        text=full_message,
-    )
-
-
 async def main():
     logger.info("Starting daily digest generation...")
 
-    if not Config.TELEGRAM_BOT_TOKEN:
-        logger.error("TELEGRAM_BOT_TOKEN not set")
-        sys.exit(1)
-
-    if not Config.TELEGRAM_OWNER_ID:
-        logger.error("TELEGRAM_OWNER_ID not set")
-        sys.exit(1)
-
-    bot = Bot(token=Config.TELEGRAM_BOT_TOKEN)
-
     try:
         logger.info("Generating daily digest...")
         digest_content = await generate_daily_digest()
-        logger.info(f"Digest generated ({len(digest_content)} chars)")
+        logger.info("Digest generated (%s chars)", len(digest_content))
 
-        await send_digest(bot, Config.TELEGRAM_OWNER_ID, digest_content)
+        date_str = format_digest_date()
+        await send_to_owner(f"☀️ **Daily Digest - {date_str}**\n\n{digest_content}")
         logger.info("Daily digest sent successfully")
 
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         sys.exit(1)
 
     finally:
@@ -14,13 +14,14 @@ from pathlib import Path
 # Add bot directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "bot"))
 
-from db import check_health, close_pool
+from db import check_health_fast
 
 
 async def main():
     try:
-        # Check database
-        if not await check_health():
+        # Check database with a single direct connection - monitors run
+        # this every few seconds, so skip the full pool warmup
+        if not await check_health_fast():
             print("UNHEALTHY: Database connection failed")
             sys.exit(1)
 
@@ -31,9 +32,6 @@ async def main():
         print(f"UNHEALTHY: {e}")
         sys.exit(1)
 
-    finally:
-        await close_pool()
-
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -8,6 +8,10 @@ from unittest.mock import AsyncMock, patch, MagicMock
 # Add bot directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "bot"))
 
+from main import LeaknoteBot
+from config import Config
+from router import route_message
+
 
 @pytest.mark.integration
 class TestClarificationWorkflow:
@@ -22,18 +26,16 @@ class TestClarificationWorkflow:
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_clarification_reply_with_category_prefix(
-        self, mock_db_pool, mock_llm_client, sample_pending_clarification
+        self, mock_db_pool, mock_db_conn, mock_llm_client, sample_pending_clarification
     ):
         """Test replying to clarification with category prefix."""
-        from main import LeaknoteBot
-        from config import Config
 
         # Setup
         bot = LeaknoteBot()
         bot.inbox_room_id = "!test:localhost"
 
         # Mock pending clarification exists
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.fetchrow.return_value = sample_pending_clarification
         conn.fetchval.return_value = "new-record-123"
         conn.execute.return_value = "DELETE 1"
@@ -77,16 +79,15 @@ class TestClarificationWorkflow:
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_clarification_reply_with_skip(
-        self, mock_db_pool, sample_pending_clarification
+        self, mock_db_pool, mock_db_conn, sample_pending_clarification
     ):
         """Test replying to clarification with 'skip'."""
-        from main import LeaknoteBot
 
         bot = LeaknoteBot()
         bot.inbox_room_id = "!test:localhost"
 
         # Mock database
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.execute.return_value = "DELETE 1"
 
         # Mock Matrix client
@@ -126,17 +127,15 @@ class TestClarificationWorkflow:
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_clarification_reply_with_new_text(
-        self, mock_db_pool, mock_llm_client, sample_pending_clarification, sample_classification
+        self, mock_db_pool, mock_db_conn, mock_llm_client, sample_pending_clarification, sample_classification
     ):
         """Test replying to clarification with completely new text."""
-        from main import LeaknoteBot
-        from config import Config
 
         bot = LeaknoteBot()
         bot.inbox_room_id = "!test:localhost"
 
         # Mock database
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.fetchrow.return_value = sample_pending_clarification
         conn.fetchval.return_value = "new-record-123"
         conn.execute.return_value = "DELETE 1"
@@ -185,7 +184,6 @@ class TestClarificationWorkflow:
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_extract_reply_text_removes_quotes(self):
         """Test that extract_reply_text removes quoted content."""
-        from main import LeaknoteBot
 
         bot = LeaknoteBot()
 
@@ -203,7 +201,6 @@ class TestClarificationWorkflow:
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_extract_reply_text_multiline_reply(self):
         """Test extracting multi-line reply text."""
-        from main import LeaknoteBot
 
         bot = LeaknoteBot()
 
@@ -220,11 +217,9 @@ class TestClarificationWorkflow:
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_clarification_created_for_low_confidence(
-        self, mock_db_pool, mock_llm_client
+        self, mock_db_pool, mock_db_conn, mock_llm_client
     ):
         """Test that clarification is created when confidence is low."""
-        from router import route_message
-        from config import Config
 
         # Mock low-confidence classification
         low_confidence = {
@@ -239,7 +234,7 @@ class TestClarificationWorkflow:
         }
         mock_llm_client.complete_json = AsyncMock(return_value=low_confidence)
 
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.fetchval.return_value = "inbox-log-123"
 
         with patch("db.get_pool", return_value=mock_db_pool), \
@@ -258,15 +253,13 @@ class TestClarificationWorkflow:
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
     async def test_clarification_not_created_for_high_confidence(
-        self, mock_db_pool, mock_llm_client, sample_classification
+        self, mock_db_pool, mock_db_conn, mock_llm_client, sample_classification
     ):
         """Test that clarification is NOT created when confidence is high."""
-        from router import route_message
-        from config import Config
 
         mock_llm_client.complete_json = AsyncMock(return_value=sample_classification)
 
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.fetchval.return_value = "record-123"
 
         with patch("db.get_pool", return_value=mock_db_pool), \
@@ -284,9 +277,8 @@ class TestClarificationWorkflow:
 
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Needs rewrite for Telegram bot architecture")
-    async def test_get_original_event_id_follows_thread(self, mock_db_pool):
+    async def test_get_original_event_id_follows_thread(self, mock_db_pool, mock_db_conn):
         """Test that get_original_event_id follows reply thread."""
-        from main import LeaknoteBot
 
         bot = LeaknoteBot()
         bot.client = AsyncMock()
@@ -297,7 +289,7 @@ class TestClarificationWorkflow:
             "id": 1,
             "matrix_event_id": "$original_user_message",
         }
-        conn = await mock_db_pool.acquire().__aenter__()
+        conn = mock_db_conn
         conn.fetchrow.return_value = inbox_log
 
         # Mock room_get_event to return bot's message that replies to user's message
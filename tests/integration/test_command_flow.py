@@ -6,9 +6,6 @@ NOTE: These tests were written for the Matrix bot architecture and need to be re
 For now, they are marked as skipped.
 """
 
-Tests that verify commands are correctly recognized and not sent to LLM classification.
-"""
-
 import pytest
 import sys
 from pathlib import Path
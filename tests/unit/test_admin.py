@@ -28,15 +28,16 @@ class TestAdminDependencies:
     def test_get_table_config_valid_table(self):
         """Test getting config for a valid table."""
         config = get_table_config("people")
-        assert config["display_name"] == "People"
-        assert config["is_markdown"] is False
-        assert len(config["fields"]) > 0
+        assert config.display_name == "People"
+        assert config.is_markdown is False
+        assert len(config.fields) > 0
 
     def test_get_table_config_markdown_table(self):
         """Test getting config for a markdown table."""
         config = get_table_config("decisions")
-        assert config["display_name"] == "Decisions"
-        assert config["is_markdown"] is True
+        assert config.display_name == "Decisions"
+        assert config.is_markdown is True
+        assert len(config.markdown_fields) > 0
 
     def test_get_table_config_invalid_table(self):
         """Test getting config for an invalid table."""
@@ -49,10 +50,10 @@ class TestAdminDependencies:
         for table in VALID_TABLES:
             config = get_table_config(table)
             assert config is not None
-            assert "display_name" in config
-            assert "fields" in config
-            assert "list_columns" in config
-            assert "is_markdown" in config
+            assert config.display_name
+            assert config.fields is not None
+            assert config.list_columns
+            assert isinstance(config.is_markdown, bool)
 
 
 @pytest.mark.unit
@@ -188,7 +189,7 @@ class TestTableConfigs:
     def test_people_table_config(self):
         """Test people table has correct fields."""
         config = get_table_config("people")
-        field_names = [f["name"] for f in config["fields"]]
+        field_names = [f.name for f in config.fields]
         assert "name" in field_names
         assert "context" in field_names
         assert "follow_ups" in field_names
@@ -198,7 +199,7 @@ class TestTableConfigs:
     def test_projects_table_config(self):
         """Test projects table has correct fields."""
         config = get_table_config("projects")
-        field_names = [f["name"] for f in config["fields"]]
+        field_names = [f.name for f in config.fields]
         assert "name" in field_names
         assert "status" in field_names
         assert "next_action" in field_names
@@ -207,18 +208,18 @@ class TestTableConfigs:
     def test_decisions_table_config(self):
         """Test decisions table has markdown fields."""
         config = get_table_config("decisions")
-        assert config["is_markdown"] is True
-        markdown_fields = [f for f in config["fields"] if f["type"] == "markdown"]
-        assert len(markdown_fields) > 0
+        assert config.is_markdown is True
+        assert len(config.markdown_fields) > 0
+        assert all(f.type == "markdown" for f in config.markdown_fields)
 
     def test_reference_tables_use_markdown(self):
         """Test all reference category tables use markdown."""
         for table in ["decisions", "howtos", "snippets"]:
             config = get_table_config(table)
-            assert config["is_markdown"] is True, f"{table} should use markdown"
+            assert config.is_markdown is True, f"{table} should use markdown"
 
     def test_dynamic_tables_no_markdown(self):
         """Test dynamic category tables don't use markdown."""
         for table in ["people", "projects", "ideas", "admin"]:
             config = get_table_config(table)
-            assert config["is_markdown"] is False, f"{table} should not use markdown"
+            assert config.is_markdown is False, f"{table} should not use markdown"